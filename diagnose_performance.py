@@ -4,63 +4,130 @@
 用于找出 LLM 处理中的阻塞点
 """
 import asyncio
+import contextvars
+import inspect
+import json
 import time
 import sys
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import jieba
 
 # 测试不同的处理环节
 
 
-async def test_jieba_blocking():
+# 后台任务延迟超过该阈值视为事件循环被阻塞
+BLOCKED_THRESHOLD_MS = 20.0
+
+# 当前诊断的阶段计时记录（子任务复制上下文后仍指向同一个列表，gather 并发时也能汇总）
+_stages: contextvars.ContextVar[Optional[List[Tuple[str, float]]]] = contextvars.ContextVar(
+    "_stages", default=None
+)
+
+
+def start_profile() -> List[Tuple[str, float]]:
+    """在当前上下文开启一次新的阶段计时，返回记录列表"""
+    records: List[Tuple[str, float]] = []
+    _stages.set(records)
+    return records
+
+
+@asynccontextmanager
+async def stage(name: str):
+    """
+    记录一个阶段的耗时（perf_counter），写入当前上下文的记录列表
+    
+    用法: async with stage("keywords"): await extract(...)
+    """
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        records = _stages.get()
+        if records is not None:
+            records.append((name, time.perf_counter() - t))
+
+
+def aggregate_stages(records: List[Tuple[str, float]]) -> Dict[str, Dict[str, float]]:
+    """按阶段名汇总计时记录: {name: {total_s, count, max_s}}"""
+    summary: Dict[str, Dict[str, float]] = {}
+    for name, elapsed in records:
+        entry = summary.setdefault(name, {"total_s": 0.0, "count": 0, "max_s": 0.0})
+        entry["total_s"] += elapsed
+        entry["count"] += 1
+        entry["max_s"] = max(entry["max_s"], elapsed)
+    return summary
+
+
+async def _probe(cut_fn) -> Tuple[float, bool]:
+    """
+    执行一次分词，同时测量事件循环上的后台任务被推迟了多久
+    
+    Args:
+        cut_fn: 分词函数，可返回结果或 awaitable
+        
+    Returns:
+        (后台任务被延迟的毫秒数, 是否判定为阻塞)
+    """
+    loop = asyncio.get_running_loop()
+    delay = 0.1
+    
+    async def background_task():
+        """模拟异步任务，返回实际唤醒时间相对预期的延迟"""
+        scheduled = loop.time() + delay
+        await asyncio.sleep(delay)
+        return max(0.0, loop.time() - scheduled)
+    
+    task = asyncio.create_task(background_task())
+    await asyncio.sleep(0)  # 让后台任务先进入等待
+    
+    start = time.perf_counter()
+    result = cut_fn()
+    if inspect.isawaitable(result):
+        result = await result
+    elapsed = time.perf_counter() - start
+    
+    blocked_ms = (await task) * 1000
+    print(f"  分词耗时: {elapsed:.3f}s, 分词数: {len(result)}, 后台任务延迟: {blocked_ms:.1f}ms")
+    return blocked_ms, blocked_ms > BLOCKED_THRESHOLD_MS
+
+
+async def test_jieba_blocking() -> Dict[str, float]:
     """测试 jieba 是否阻塞"""
     print("\n" + "="*60)
     print("测试 1: jieba 分词是否阻塞事件循环")
     print("="*60)
     
-    import jieba
+    from src.processor.extractor import _cut_worker, _get_jieba_pool
     
     text = "这是一个测试文本。" * 1000  # 长文本
+    loop = asyncio.get_running_loop()
     
-    async def async_task(name, delay):
-        """模拟异步任务"""
-        await asyncio.sleep(delay)
-        print(f"  [{name}] 完成 (预期在 {delay}s)")
+    # 先加载主进程词典并启动进程池 worker，避免加载耗时干扰测量
+    jieba.initialize()
+    pool = _get_jieba_pool()
+    await loop.run_in_executor(pool, _cut_worker, "预热")
     
     print("\n同步执行 jieba.cut（会阻塞）:")
-    start = time.time()
-    
-    # 启动一个定时任务
-    task = asyncio.create_task(async_task("后台任务", 0.1))
+    sync_blocked_ms, sync_blocked = await _probe(lambda: list(jieba.cut(text)))
     
-    # 同步执行 jieba
-    result = list(jieba.cut(text))
-    
-    elapsed = time.time() - start
-    print(f"jieba.cut 耗时: {elapsed:.3f}s, 分词数: {len(result)}")
-    
-    # 检查后台任务是否被延迟
-    if not task.done():
-        print("警告: 后台任务被阻塞！")
-        await task
-    else:
-        print("后台任务正常执行")
-    
-    print("\n异步执行 jieba.cut（使用线程池）:")
-    start = time.time()
-    
-    task = asyncio.create_task(async_task("后台任务", 0.1))
-    
-    # 在线程池中执行
-    result = await asyncio.to_thread(lambda: list(jieba.cut(text)))
+    # 在进程池中执行（jieba 持有 GIL，线程池无法真正并行）
+    print("\n异步执行 jieba.cut（使用进程池）:")
+    async_blocked_ms, async_blocked = await _probe(
+        lambda: loop.run_in_executor(pool, _cut_worker, text)
+    )
     
-    elapsed = time.time() - start
-    print(f"jieba.cut (线程池) 耗时: {elapsed:.3f}s, 分词数: {len(result)}")
+    for label, blocked in (("同步", sync_blocked), ("进程池", async_blocked)):
+        print(f"{label}: {'警告: 后台任务被阻塞！' if blocked else '后台任务正常执行'}")
     
-    if not task.done():
-        print("警告: 后台任务被阻塞！")
-        await task
-    else:
-        print("后台任务正常执行")
+    results = {
+        "sync_blocked_ms": round(sync_blocked_ms, 1),
+        "async_blocked_ms": round(async_blocked_ms, 1),
+    }
+    print(json.dumps(results))
+    return results
 
 
 async def test_extractor_performance():
@@ -87,9 +154,9 @@ async def test_extractor_performance():
     )
     
     print("异步提取关键词...")
-    start = time.time()
+    start = time.perf_counter()
     keywords = await extractor.extract(item, top_k=10)
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     print(f"提取完成: {elapsed:.3f}s, 关键词: {keywords}")
 
 
@@ -119,7 +186,7 @@ async def test_llm_api_latency():
     
     import openai
     
-    start = time.time()
+    start = time.perf_counter()
     try:
         response = await processor.client.chat.completions.create(
             model=processor.model,
@@ -129,7 +196,7 @@ async def test_llm_api_latency():
             ],
             max_tokens=10
         )
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         print(f"单条 API 调用耗时: {elapsed:.3f}s")
         print(f"响应: {response.choices[0].message.content}")
     except Exception as e:
@@ -143,7 +210,7 @@ async def test_full_pipeline():
     print("="*60)
     
     from src.models import ContentItem, SourceType
-    from src.processor.summarizer import ContentProcessor
+    from src.processor.summarizer import ContentProcessor, LLMSummarizer
     
     # 创建测试数据
     items = []
@@ -165,47 +232,41 @@ async def test_full_pipeline():
     
     print(f"\n处理 {len(items)} 条内容...")
     
-    # 记录每个阶段的时间
-    stage_times = {}
-    
-    # 阶段 1: 清洗
-    start = time.time()
-    for item in items:
-        if item.content:
-            if "<" in item.content and ">" in item.content:
-                item.content = processor.cleaner.clean(item.content)
-            else:
-                item.content = processor.cleaner.clean_markdown(item.content)
-    stage_times['clean'] = time.time() - start
-    
-    # 阶段 2: 关键词提取（异步）
-    start = time.time()
-    for item in items:
-        item.keywords = await processor.keyword_extractor.extract(item)
-    stage_times['keywords'] = time.time() - start
-    
-    # 阶段 3: 实体提取
-    start = time.time()
-    for item in items:
-        item.entities = processor.entity_extractor.extract(item)
-    stage_times['entities'] = time.time() - start
-    
-    # 阶段 4: 主题分类
-    start = time.time()
-    for item in items:
-        item.topics = processor.topic_classifier.classify(item)
-    stage_times['topics'] = time.time() - start
-    
-    # 阶段 5: LLM 摘要
-    start = time.time()
-    for item in items:
-        item.summary = await processor.summarizer.summarize(item)
-    stage_times['llm_summary'] = time.time() - start
+    # 记录每个阶段的时间（子阶段以 "阶段.item" 命名，只计入明细不计入总计）
+    records = start_profile()
+    
+    async def preprocess(item):
+        async with stage("preprocess.item"):
+            await asyncio.to_thread(processor.process_item_cpu, item)
+    
+    # 阶段 1-4: 清洗 + 关键词 + 实体 + 主题（单次遍历，各条目在线程池并发）
+    async with stage("preprocess"):
+        await asyncio.gather(*(preprocess(item) for item in items))
+    
+    # 阶段 5: LLM 摘要（多条打包为一次调用；无 LLM 时按条并发，信号量限制并发数）
+    semaphore = asyncio.Semaphore(processor.max_concurrency)
+    
+    async def summarize(item):
+        async with semaphore:
+            async with stage("llm_summary.item"):
+                item.summary = await processor.summarizer.summarize(item)
+    
+    async with stage("llm_summary"):
+        if isinstance(processor.summarizer, LLMSummarizer) and processor.summarizer.client:
+            await processor.summarizer.batch_summarize_marshaled(items, k=5)
+        else:
+            await asyncio.gather(*(summarize(item) for item in items))
+    
+    stats = aggregate_stages(records)
+    stage_times = {name: v["total_s"] for name, v in stats.items() if "." not in name}
     
     # 打印结果
     print("\n各阶段耗时:")
-    for stage, t in stage_times.items():
-        print(f"  {stage}: {t:.3f}s ({t/len(items):.3f}s/条)")
+    for name, t in stage_times.items():
+        print(f"  {name}: {t:.3f}s ({t/len(items):.3f}s/条)")
+    
+    print("\n计时明细:")
+    print(json.dumps(stats, ensure_ascii=False, indent=2))
     
     total = sum(stage_times.values())
     print(f"\n总计: {total:.3f}s, 平均: {total/len(items):.3f}s/条")
@@ -237,20 +298,36 @@ async def test_concurrency():
         )
         items.append(item)
     
+    # 复用同一个摘要器，只改变批量调用的并发数（避免重复初始化，测得稳态延迟）
+    summarizer = LLMSummarizer(max_concurrency=5)
+    
+    if not summarizer.client:
+        print("跳过: LLM 未配置")
+        return
+    
+    records = start_profile()
+    
     # 测试不同并发数
     for concurrency in [1, 3, 5]:
         print(f"\n并发数: {concurrency}")
-        summarizer = LLMSummarizer(max_concurrency=concurrency)
-        
-        if not summarizer.client:
-            print("跳过: LLM 未配置")
-            continue
         
-        start = time.time()
-        results = await summarizer.batch_summarize(items[:5], use_batch_api=False)
-        elapsed = time.time() - start
+        async with stage(f"concurrency_{concurrency}"):
+            results = await summarizer.batch_summarize(
+                items[:5], max_concurrency=concurrency, use_batch_api=False
+            )
+        elapsed = records[-1][1]
         
         print(f"  处理 5 条耗时: {elapsed:.3f}s, 平均: {elapsed/5:.3f}s/条")
+    
+    print("\n打包模式:")
+    async with stage("marshaled"):
+        results = await summarizer.batch_summarize_marshaled(items[:5], k=5)
+    elapsed = records[-1][1]
+    
+    print(f"  打包处理 5 条耗时: {elapsed:.3f}s (1 次 API 调用)")
+    
+    print("\n计时明细:")
+    print(json.dumps(aggregate_stages(records), ensure_ascii=False, indent=2))
 
 
 async def main():
@@ -2,46 +2,114 @@
 认证管理模块
 提供交互式 Cookie/Token 获取、加密存储和验证功能
 """
-import json
+import asyncio
+import base64
+import hashlib
 import re
 import shlex
+import time
+import weakref
+import zlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 import httpx
+import orjson
 from cryptography.fernet import Fernet
 
 from src.config import get_settings
-from src.database import AuthCredentialDB, get_session
+from src.database import AuthCredentialDB, AuthCredentialRepository, get_session
 
 settings = get_settings()
 
+# PowerShell cURL 解析用正则（模块加载时预编译）
+_PS_HEADERS_RE = re.compile(r'-Headers @\{([^}]+)\}')
+_PS_KV_RE = re.compile(r'"([^"]+)"\s*=\s*"([^"]*)"')
+_PS_URI_RE = re.compile(r'-(?:Uri|Url)\s+"([^"]+)"')
+_PS_METHOD_RE = re.compile(r'-Method\s+(\w+)')
+
+# Cookie 字符串解析（单次扫描 key=value 对）
+_COOKIE_RE = re.compile(r'([^=;\s]+)\s*=([^;]*)')
+
 
 # 加密密钥（从配置获取或使用默认）
-def get_encryption_key() -> bytes:
-    """获取加密密钥"""
+@lru_cache(maxsize=1)
+def _fernet() -> Fernet:
+    """获取 Fernet 实例（配置只读取一次，密钥派生只做一次）"""
     # 使用 API_SECRET_KEY 生成稳定的密钥
-    import base64
-    import hashlib
-    
-    key_base = settings.api_secret_key
-    key_hash = hashlib.sha256(key_base.encode()).digest()
-    return base64.urlsafe_b64encode(key_hash)
+    key_hash = hashlib.sha256(settings.api_secret_key.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(key_hash))
+
+
+# 凭证存储格式版本前缀（旧格式为未压缩的 Fernet token，以 "gAAAAA" 开头，不会冲突）
+_CREDENTIAL_FORMAT_ZLIB = "1"
 
 
 def encrypt_credentials(data: str) -> str:
-    """加密凭证数据"""
-    f = Fernet(get_encryption_key())
-    return f.encrypt(data.encode()).decode()
+    """加密凭证数据（先 zlib 压缩，Cookie 中大量重复的 key=hex 压缩率很高）"""
+    token = _fernet().encrypt(zlib.compress(data.encode(), 6))
+    return _CREDENTIAL_FORMAT_ZLIB + token.decode()
 
 
 def decrypt_credentials(encrypted_data: str) -> str:
-    """解密凭证数据"""
-    f = Fernet(get_encryption_key())
-    return f.decrypt(encrypted_data.encode()).decode()
+    """解密凭证数据（兼容未压缩的旧格式）"""
+    if encrypted_data.startswith(_CREDENTIAL_FORMAT_ZLIB):
+        token = encrypted_data[len(_CREDENTIAL_FORMAT_ZLIB):].encode()
+        return zlib.decompress(_fernet().decrypt(token)).decode()
+    return _fernet().decrypt(encrypted_data.encode()).decode()
+
+
+# 共享 HTTP 客户端（复用连接池，避免每次验证都重新握手）
+# 连接绑定在创建时的事件循环上，每个事件循环各用一个客户端: loop -> (客户端, 关闭守护)
+_http_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def _close_on_loop_shutdown(client: httpx.AsyncClient):
+    """
+    关闭守护：挂起的异步生成器
+    
+    asyncio.run / Runner 关闭事件循环前会调用 shutdown_asyncgens，此时在所属循环中
+    执行 finally 关闭客户端；循环关闭后连接已无法再正常关闭
+    """
+    try:
+        yield
+    finally:
+        loop = asyncio.get_running_loop()
+        if _http_clients.get(loop, (None,))[0] is client:
+            del _http_clients[loop]
+        await client.aclose()
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """获取当前事件循环的共享 HTTP 客户端（延迟创建，循环关闭时自动关闭）"""
+    loop = asyncio.get_running_loop()
+    entry = _http_clients.get(loop)
+    if entry is None or entry[0].is_closed:
+        client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32)
+        )
+        guard = _close_on_loop_shutdown(client)
+        await guard.asend(None)
+        entry = _http_clients[loop] = (client, guard)
+    return entry[0]
+
+
+async def close_http_client():
+    """关闭当前事件循环的共享 HTTP 客户端"""
+    entry = _http_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].aclose()
+
+
+# 解密后凭证的进程内缓存: source_name -> (过期时间, 密文, cookie, headers)
+_credential_cache: Dict[str, Tuple[float, str, str, dict]] = {}
+# 缓存最长有效期（秒）
+CREDENTIAL_CACHE_TTL = 60.0
 
 
 @dataclass
@@ -256,14 +324,12 @@ class CURLParser:
     @staticmethod
     def _parse_powershell_curl(curl_command: str, result: Dict[str, Any]) -> Dict[str, Any]:
         """解析 PowerShell 格式的 cURL 命令"""
-        import re
-        
         # 提取 Headers
-        headers_match = re.search(r'-Headers @\{([^}]+)\}', curl_command)
+        headers_match = _PS_HEADERS_RE.search(curl_command)
         if headers_match:
             headers_str = headers_match.group(1)
             # 解析 "Key"="Value" 格式
-            for match in re.finditer(r'"([^"]+)"\s*=\s*"([^"]*)"', headers_str):
+            for match in _PS_KV_RE.finditer(headers_str):
                 key, value = match.groups()
                 key_lower = key.lower()
                 if key_lower == "cookie":
@@ -273,12 +339,12 @@ class CURLParser:
                     result["headers"][key_lower] = value
         
         # 提取 URI/URL
-        uri_match = re.search(r'-(?:Uri|Url)\s+"([^"]+)"', curl_command)
+        uri_match = _PS_URI_RE.search(curl_command)
         if uri_match:
             result["url"] = uri_match.group(1)
         
         # 提取 Method
-        method_match = re.search(r'-Method\s+(\w+)', curl_command)
+        method_match = _PS_METHOD_RE.search(curl_command)
         if method_match:
             result["method"] = method_match.group(1).upper()
         
@@ -327,13 +393,7 @@ class CURLParser:
     @staticmethod
     def _parse_cookie_string(cookie_str: str) -> Dict[str, str]:
         """解析 cookie 字符串为字典"""
-        cookies = {}
-        for item in cookie_str.split(";"):
-            item = item.strip()
-            if "=" in item:
-                key, value = item.split("=", 1)
-                cookies[key.strip()] = value.strip()
-        return cookies
+        return {m.group(1): m.group(2).strip() for m in _COOKIE_RE.finditer(cookie_str)}
     
     @staticmethod
     def extract_essential_headers(parsed: Dict[str, Any], config: AuthConfig) -> Dict[str, str]:
@@ -370,6 +430,30 @@ class AuthManager:
         """获取指定渠道的配置"""
         return self.configs.get(source_name)
     
+    def _get_decrypted(self, credential: AuthCredentialDB) -> Tuple[str, dict]:
+        """获取解密后的 cookie 和 headers（带 TTL 缓存）"""
+        now = time.monotonic()
+        cached = _credential_cache.get(credential.source_name)
+        # 密文变化（其他进程更新了凭证）时缓存自动失效
+        if cached and cached[0] > now and cached[1] == credential.credentials:
+            return cached[2], dict(cached[3])
+        
+        cookie_str = decrypt_credentials(credential.credentials)
+        headers = orjson.loads(credential.headers or "{}")
+        
+        ttl = CREDENTIAL_CACHE_TTL
+        if credential.expires_at:
+            expires_at = credential.expires_at
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            ttl = min(ttl, (expires_at - datetime.now(timezone.utc)).total_seconds())
+        if ttl > 0:
+            _credential_cache[credential.source_name] = (
+                now + ttl, credential.credentials, cookie_str, headers
+            )
+        
+        return cookie_str, dict(headers)
+    
     async def add_auth(
         self, 
         source_name: str, 
@@ -410,17 +494,18 @@ class AuthManager:
             source_name=source_name,
             auth_type=config.auth_type,
             credentials=credentials,
-            headers=json.dumps(headers, ensure_ascii=False),
+            headers=orjson.dumps(headers).decode(),
             username=username,
             expires_at=expires_at,
             is_valid=True
         )
         
         async with get_session() as session:
-            from src.database import AuthCredentialRepository
             repo = AuthCredentialRepository(session)
             await repo.create_or_update(credential)
         
+        _credential_cache.pop(source_name, None)
+        
         return True, f"✅ [{config.display_name}] 认证配置已保存，过期时间: {expires_at.strftime('%Y-%m-%d %H:%M')}"
     
     async def test_auth(self, source_name: str) -> Tuple[bool, str, Optional[dict]]:
@@ -437,50 +522,45 @@ class AuthManager:
         if not config:
             return False, f"不支持的渠道: {source_name}", None
         
-        # 获取凭证
+        # 单个会话覆盖 读取凭证 → HTTP 测试 → 更新状态
         async with get_session() as session:
-            from src.database import AuthCredentialRepository
             repo = AuthCredentialRepository(session)
             credential = await repo.get_by_source(source_name)
-        
-        if not credential:
-            return False, f"未找到 [{config.display_name}] 的认证配置，请先运行: auth add {source_name}", None
-        
-        if not credential.is_valid:
-            return False, f"[{config.display_name}] 认证已失效，请更新: auth update {source_name}", None
-        
-        # 对严格反爬平台，跳过 HTTP 测试（它们有动态签名机制）
-        strict_platforms = ['douyin']
-        if source_name in strict_platforms:
-            # 只验证 cookie 存在且未过期
-            try:
-                cookie_str = decrypt_credentials(credential.credentials)
-                if not cookie_str or len(cookie_str) < 10:
-                    return False, "Cookie 无效", None
-                
-                # 检查是否有过期标志的 cookie
-                has_session = any(key in cookie_str for key in ['web_session', 'session'])
-                
-                # 更新验证时间
-                async with get_session() as session:
-                    from src.database import AuthCredentialRepository
-                    repo = AuthCredentialRepository(session)
+            
+            if not credential:
+                return False, f"未找到 [{config.display_name}] 的认证配置，请先运行: auth add {source_name}", None
+            
+            if not credential.is_valid:
+                return False, f"[{config.display_name}] 认证已失效，请更新: auth update {source_name}", None
+            
+            # 对严格反爬平台，跳过 HTTP 测试（它们有动态签名机制）
+            strict_platforms = ['douyin']
+            if source_name in strict_platforms:
+                # 只验证 cookie 存在且未过期
+                try:
+                    cookie_str, _ = self._get_decrypted(credential)
+                    if not cookie_str or len(cookie_str) < 10:
+                        return False, "Cookie 无效", None
+                    
+                    # 检查是否有过期标志的 cookie
+                    has_session = any(key in cookie_str for key in ['web_session', 'session'])
+                    
+                    # 更新验证时间
                     await repo.update_last_verified(source_name)
+                    
+                    return True, "Cookie 已配置（跳过了严格平台的 HTTP 测试）", None
                 
-                return True, "Cookie 已配置（跳过了严格平台的 HTTP 测试）", None
-                
-            except Exception as e:
-                return False, f"验证失败: {str(e)}", None
-        
-        # 其他平台进行 HTTP 测试
-        try:
-            # 解密凭证
-            cookie_str = decrypt_credentials(credential.credentials)
-            headers = json.loads(credential.headers or "{}")
-            headers["Cookie"] = cookie_str
+                except Exception as e:
+                    return False, f"验证失败: {str(e)}", None
             
-            # 发送测试请求
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            # 其他平台进行 HTTP 测试
+            try:
+                # 解密凭证（带缓存）
+                cookie_str, headers = self._get_decrypted(credential)
+                headers["Cookie"] = cookie_str
+                
+                # 发送测试请求（共享客户端，复用连接）
+                client = await get_http_client()
                 response = await client.request(
                     method=config.test_method,
                     url=config.test_endpoint,
@@ -491,10 +571,7 @@ class AuthManager:
                 # 检查响应
                 if response.status_code == 200:
                     # 更新最后验证时间
-                    async with get_session() as session:
-                        from src.database import AuthCredentialRepository
-                        repo = AuthCredentialRepository(session)
-                        await repo.update_last_verified(source_name)
+                    await repo.update_last_verified(source_name)
                     
                     # 尝试解析用户信息
                     user_info = await self._parse_user_info(source_name, response)
@@ -502,22 +579,45 @@ class AuthManager:
                 
                 elif response.status_code in (401, 403):
                     # 认证失效
-                    async with get_session() as session:
-                        from src.database import AuthCredentialRepository
-                        repo = AuthCredentialRepository(session)
-                        await repo.mark_invalid(source_name, f"HTTP {response.status_code}")
+                    await repo.mark_invalid(source_name, f"HTTP {response.status_code}")
                     return False, f"认证已失效 (HTTP {response.status_code})，请更新", None
                 
                 else:
                     return False, f"请求失败 (HTTP {response.status_code})", None
-                    
-        except Exception as e:
-            return False, f"测试失败: {str(e)}", None
+            
+            except Exception as e:
+                return False, f"测试失败: {str(e)}", None
+
+    async def test_all_auth(
+        self,
+        sources: Optional[list] = None,
+        concurrency: int = 6
+    ) -> Dict[str, Tuple[bool, str, Optional[dict]]]:
+        """
+        并发测试多个渠道的认证
+        
+        Args:
+            sources: 渠道名称列表（默认为所有已配置认证的渠道）
+            concurrency: 最大并发数
+            
+        Returns:
+            {渠道名称: (是否有效, 消息, 用户信息)}
+        """
+        if sources is None:
+            sources = [cred["source_name"] for cred in await self.list_auth()]
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _test_one(source_name: str):
+            async with semaphore:
+                return source_name, await self.test_auth(source_name)
+        
+        return dict(await asyncio.gather(*(_test_one(s) for s in sources)))
     
     async def _parse_user_info(self, source_name: str, response: httpx.Response) -> Optional[dict]:
         """解析用户信息"""
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if source_name == "jike":
                 user = data.get("user", {})
@@ -561,10 +661,11 @@ class AuthManager:
         display_name = config.display_name if config else source_name
         
         async with get_session() as session:
-            from src.database import AuthCredentialRepository
             repo = AuthCredentialRepository(session)
             success = await repo.delete(source_name)
         
+        _credential_cache.pop(source_name, None)
+        
         if success:
             return True, f"✅ [{display_name}] 认证配置已删除"
         else:
@@ -573,9 +674,8 @@ class AuthManager:
     async def list_auth(self) -> list:
         """列出所有认证配置"""
         async with get_session() as session:
-            from src.database import AuthCredentialRepository
             repo = AuthCredentialRepository(session)
-            credentials = await repo.get_all()
+            credentials = await repo.get_all_summaries()
         
         result = []
         for cred in credentials:
@@ -596,7 +696,6 @@ class AuthManager:
     async def get_expiring_soon(self, hours: int = 72) -> list:
         """获取即将过期的认证"""
         async with get_session() as session:
-            from src.database import AuthCredentialRepository
             repo = AuthCredentialRepository(session)
             credentials = await repo.get_expiring_soon(hours)
         
@@ -10,8 +10,24 @@
 - 抖音 (douyin)
 """
 import asyncio
+import atexit
+import json
+import os
+import shlex
+import time
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
+from src.auth_manager import get_auth_manager, AUTH_CONFIGS, encrypt_credentials, decrypt_credentials
+from src.config import DATA_DIR
+
+__all__ = [
+    "BrowserAuthHelper",
+    "interactive_auth",
+    "close_browser",
+    "is_browser_auth_available",
+]
+
 
 # Playwright 延迟导入，避免未安装时报错
 def _get_playwright():
@@ -26,12 +42,249 @@ def _get_playwright():
         )
 
 
-from src.auth_manager import get_auth_manager, AUTH_CONFIGS
+# 登录阶段可直接丢弃的资源（图片/CSS 仍需加载：登录页要正常显示，二维码多为图片）
+BLOCKED_ASSETS_GLOB = "**/*.{woff,woff2,ttf,otf,eot,mp4,webm,mp3}"
+
+
+# 登录完成后只读取文本节点，这些资源类型可全部丢弃
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+async def _install_blocklist(page):
+    """拦截并丢弃图片/媒体/字体/样式请求，其余请求交给后续路由或正常放行"""
+    async def handle(route, request):
+        if request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.fallback()
+    
+    await page.route("**/*", handle)
+
+
+# 获取用户昵称的时间上限（秒），仅用于展示，不应拖慢认证
+USER_INFO_TIMEOUT = 2.5
+
+
+# 各平台用户昵称所在页面及选择器
+_USER_INFO_TABLE: Dict[str, Tuple[str, str]] = {
+    "zhihu": ("https://www.zhihu.com/people/me", ".ProfileHeader-name"),
+    "jike": ("https://web.okjike.com/", ".user-name"),
+}
+
+
+# 捕获的请求头中需要移除的字段（小写）
+_STRIP_HEADERS = frozenset({"cookie", "content-length", "host"})
+
+# 无法读取浏览器 UA 时的默认值
+_DEFAULT_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# 通用请求头
+_BASE_HEADERS: Dict[str, str] = {
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-site',
+}
+
+# 各平台的静态请求头（浏览器未捕获到请求时使用）
+_PLATFORM_HEADERS: Dict[str, Dict[str, str]] = {
+    "zhihu": {
+        "Referer": "https://www.zhihu.com/",
+        "x-requested-with": "fetch",
+    },
+    "jike": {
+        "Referer": "https://web.okjike.com/",
+        "Origin": "https://web.okjike.com",
+    },
+}
+
+
+# 浏览器登录状态（Cookie + localStorage）持久化目录及有效期，加密存储
+STORAGE_STATE_DIR = DATA_DIR / "browser_state"
+STORAGE_STATE_MAX_AGE = 12 * 3600
+
+
+def _load_storage_state(source_name: str) -> Optional[dict]:
+    """读取未过期的已保存登录状态，不存在/过期/无法解密时返回 None"""
+    path = STORAGE_STATE_DIR / f"{source_name}.state"
+    try:
+        if time.time() - path.stat().st_mtime > STORAGE_STATE_MAX_AGE:
+            return None
+        return json.loads(decrypt_credentials(path.read_text()))
+    except Exception:
+        return None
+
+
+def _save_storage_state(source_name: str, state: dict):
+    """加密保存登录状态，供下次认证跳过登录"""
+    STORAGE_STATE_DIR.mkdir(parents=True, exist_ok=True)
+    path = STORAGE_STATE_DIR / f"{source_name}.state"
+    path.write_text(encrypt_credentials(json.dumps(state)))
+    os.chmod(path, 0o600)
+
+
+# 系统 Chrome 候选路径
+CHROME_PATHS = (
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    "/Applications/Chrome.app/Contents/MacOS/Chrome",
+    "/usr/bin/google-chrome",
+    "/usr/bin/chromium",
+    "/usr/bin/chromium-browser",
+    "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
+    "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",
+)
+
+
+@lru_cache(maxsize=1)
+def _discover_chrome_executable() -> Optional[str]:
+    """查找系统 Chrome（文件系统布局在进程内不变，只探测一次）"""
+    for chrome_path in CHROME_PATHS:
+        if os.path.exists(chrome_path):
+            return chrome_path
+    return None
+
+
+# 进程级 Playwright + 浏览器单例（Playwright 对象绑定事件循环，循环变化时重新启动）
+_PW_SINGLETON = {"pw": None, "browser": None, "lock": None, "loop": None, "user_agent": None}
+
+
+async def _get_or_launch_browser():
+    """
+    获取共享的浏览器实例，首次调用时启动 Playwright 和 Chromium
+    
+    Returns:
+        Browser 实例
+        
+    Raises:
+        ImportError: Playwright 未安装
+        RuntimeError: 浏览器启动失败（附带提示信息）
+    """
+    loop = asyncio.get_running_loop()
+    if _PW_SINGLETON["loop"] is not loop:
+        # 旧循环上的对象无法复用，直接丢弃（驱动进程随旧循环结束）
+        _PW_SINGLETON.update(pw=None, browser=None, lock=asyncio.Lock(), loop=loop)
+        _CTX_POOL.clear()
+    
+    async with _PW_SINGLETON["lock"]:
+        browser = _PW_SINGLETON["browser"]
+        if browser is not None and browser.is_connected():
+            return browser
+        
+        async_playwright, _ = _get_playwright()
+        pw = _PW_SINGLETON["pw"]
+        if pw is None:
+            # 使用 start() 而非上下文管理器，使 Playwright 在多次调用间存活
+            pw = await async_playwright().start()
+            _PW_SINGLETON["pw"] = pw
+        
+        # 启动浏览器 - 优先使用系统 Chrome
+        browser = None
+        launch_errors = []
+        
+        # 尝试 1: 使用系统 Chrome
+        chrome_path = _discover_chrome_executable()
+        if chrome_path:
+            try:
+                browser = await pw.chromium.launch(
+                    headless=False,
+                    executable_path=chrome_path
+                )
+            except Exception as e:
+                launch_errors.append(f"{chrome_path}: {e}")
+        
+        # 尝试 2: 使用 Playwright 自带的 Chromium
+        if not browser:
+            try:
+                browser = await pw.chromium.launch(headless=False)
+            except Exception as e:
+                error_msg = str(e)
+                if "Executable doesn't exist" in error_msg:
+                    raise RuntimeError(
+                        "未找到 Chrome 浏览器\n\n"
+                        "方案 1 - 安装 Google Chrome:\n"
+                        "  下载: https://www.google.com/chrome/\n\n"
+                        "方案 2 - 使用 Playwright 自带浏览器:\n"
+                        "  python -m playwright install chromium\n\n"
+                        "安装后即可使用浏览器自动获取功能。"
+                    )
+                launch_errors.append(f"Playwright Chromium: {e}")
+        
+        if not browser:
+            raise RuntimeError(f"无法启动浏览器:\n" + "\n".join(launch_errors))
+        
+        _PW_SINGLETON.update(browser=browser, user_agent=None)
+        return browser
+
+
+# 每个渠道复用一个 BrowserContext（同一进程内多次认证免去重复创建，登录状态也得以保留）
+_CTX_POOL: Dict[str, object] = {}
+
+
+def _pooled_context(browser, source_name: str):
+    """返回属于当前浏览器的已缓存 context，没有则返回 None"""
+    context = _CTX_POOL.get(source_name)
+    if context is not None and context.browser is browser:
+        return context
+    return None
+
+
+async def _get_context(browser, source_name: str, storage_state: Optional[dict] = None):
+    """获取渠道的 context，不存在时创建并缓存"""
+    context = _pooled_context(browser, source_name)
+    if context is not None:
+        return context
+    
+    # 禁用 Service Worker：其发出的请求绕过页面路由，且会产生额外后台请求
+    context = await browser.new_context(
+        viewport={"width": 800, "height": 600},
+        service_workers="block",
+        storage_state=storage_state,
+    )
+    
+    def on_close(closed):
+        if _CTX_POOL.get(source_name) is closed:
+            del _CTX_POOL[source_name]
+    
+    context.on("close", on_close)
+    _CTX_POOL[source_name] = context
+    return context
+
+
+async def close_browser():
+    """关闭共享的浏览器和 Playwright（需在启动它们的事件循环中调用）"""
+    browser, pw = _PW_SINGLETON["browser"], _PW_SINGLETON["pw"]
+    _PW_SINGLETON.update(pw=None, browser=None)
+    _CTX_POOL.clear()
+    try:
+        if browser is not None and browser.is_connected():
+            await browser.close()
+    finally:
+        if pw is not None:
+            await pw.stop()
+
+
+def _shutdown():
+    """进程退出时清理：所属事件循环仍可用时在其上关闭，否则驱动进程随主进程退出"""
+    loop = _PW_SINGLETON["loop"]
+    if _PW_SINGLETON["pw"] is None or loop is None or loop.is_closed() or loop.is_running():
+        return
+    try:
+        loop.run_until_complete(close_browser())
+    except Exception:
+        pass
+
+
+atexit.register(_shutdown)
 
 
 class BrowserAuthHelper:
     """浏览器认证助手"""
     
+    __slots__ = ("source_name", "config", "cookie_str", "headers")
+    
     def __init__(self, source_name: str):
         self.source_name = source_name
         self.config = AUTH_CONFIGS.get(source_name)
@@ -48,77 +301,83 @@ class BrowserAuthHelper:
         if not self.config:
             return False, f"不支持的渠道: {self.source_name}"
         
-        # 延迟导入 Playwright
         try:
-            async_playwright, Page = _get_playwright()
-        except ImportError as e:
+            browser = await _get_or_launch_browser()
+        except (ImportError, RuntimeError) as e:
             return False, str(e)
         
-        async with async_playwright() as p:
-            # 启动浏览器 - 优先使用系统 Chrome
-            browser = None
-            launch_errors = []
+        # 本进程已有该渠道的 context，或近期保存过登录状态时，先尝试免登录获取，失效再走交互式登录
+        storage_state = None
+        if _pooled_context(browser, self.source_name) is None:
+            storage_state = _load_storage_state(self.source_name)
+        if storage_state or _pooled_context(browser, self.source_name) is not None:
+            try:
+                context = await _get_context(browser, self.source_name, storage_state)
+            except Exception as e:
+                return False, f"获取 Cookie 失败: {e}"
+            success, result = await self._capture_session(context, interactive=False)
+            if success:
+                return True, result
+        
+        try:
+            context = await _get_context(browser, self.source_name)
+        except Exception as e:
+            return False, f"获取 Cookie 失败: {e}"
+        return await self._capture_session(context, interactive=True)
+    
+    async def _capture_session(self, context, interactive: bool = True) -> Tuple[bool, str]:
+        """
+        在渠道的 context 中打开新页面，获取 Cookie 和请求头
+        
+        Args:
+            context: 渠道对应的 BrowserContext
+            interactive: 是否需要用户登录；否则直接使用 context 现有的登录状态
             
-            # 尝试 1: 使用系统 Chrome (Mac)
-            import os
-            chrome_paths = [
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                "/Applications/Chrome.app/Contents/MacOS/Chrome",
-                "/usr/bin/google-chrome",
-                "/usr/bin/chromium",
-                "/usr/bin/chromium-browser",
-                "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
-                "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",
-            ]
+        Returns:
+            (成功, cookie字符串或错误信息)
+        """
+        # 监听请求，捕获测试接口的请求头
+        captured_request = {}
+        captured = asyncio.Event()
+        grab_tasks = []
+        
+        async def grab_headers(request):
+            try:
+                captured_request['headers'] = await request.all_headers()
+            finally:
+                captured.set()
+        
+        # 交互模式下登录页加载时就可能请求测试接口，此时尚未登录，
+        # 只在用户确认登录完成后才开始捕获
+        listening = not interactive
+        
+        def on_request(request):
+            """观察请求并捕获 headers（只取登录后第一次命中，不暂停请求）"""
+            if listening and 'url' not in captured_request and self.config.test_endpoint in request.url:
+                captured_request['url'] = request.url
+                grab_tasks.append(asyncio.create_task(grab_headers(request)))
+        
+        page = None
+        try:
+            page = await context.new_page()
             
-            for chrome_path in chrome_paths:
-                if os.path.exists(chrome_path):
-                    try:
-                        browser = await p.chromium.launch(
-                            headless=False,
-                            executable_path=chrome_path
-                        )
-                        break
-                    except Exception as e:
-                        launch_errors.append(f"{chrome_path}: {e}")
+            # 请求头通过事件监听获取，路由只用于丢弃无用资源
+            page.on("request", on_request)
+            await page.route(BLOCKED_ASSETS_GLOB, lambda route: route.abort())
             
-            # 尝试 2: 使用 Playwright 自带的 Chromium
-            if not browser:
+            if not interactive:
+                # 使用已有的登录状态直接访问测试接口，接口返回错误说明状态已失效
+                print(f"\n正在使用已保存的 [{self.config.display_name}] 登录状态...")
                 try:
-                    browser = await p.chromium.launch(headless=False)
-                except Exception as e:
-                    error_msg = str(e)
-                    if "Executable doesn't exist" in error_msg:
-                        return False, (
-                            "未找到 Chrome 浏览器\n\n"
-                            "方案 1 - 安装 Google Chrome:\n"
-                            "  下载: https://www.google.com/chrome/\n\n"
-                            "方案 2 - 使用 Playwright 自带浏览器:\n"
-                            "  python -m playwright install chromium\n\n"
-                            "安装后即可使用浏览器自动获取功能。"
-                        )
-                    launch_errors.append(f"Playwright Chromium: {e}")
-            
-            if not browser:
-                return False, f"无法启动浏览器:\n" + "\n".join(launch_errors)
-            
-            # 设置请求拦截，捕获请求头
-            captured_request = {}
-            
-            async def handle_route(route, request):
-                """拦截请求并捕获 headers"""
-                if self.config.test_endpoint in request.url:
-                    captured_request['headers'] = await request.all_headers()
-                    captured_request['url'] = request.url
-                await route.continue_()
-            
-            context = await browser.new_context(
-                viewport={"width": 1280, "height": 800}
-            )
-            page = await context.new_page()
-            
-            # 启用请求拦截
-            await page.route("**/*", handle_route)
+                    response = await page.goto(self.config.test_endpoint)
+                except Exception:
+                    response = None
+                if response is None or not response.ok:
+                    print("已保存的登录状态已失效，需要重新登录")
+                    return False, "已保存的登录状态已失效"
+                if grab_tasks:
+                    await asyncio.wait(grab_tasks, timeout=1)
+                return await self._extract_credentials(context, page, captured_request, save_state=False)
             
             print(f"\n{'='*60}")
             print(f"正在为 [{self.config.display_name}] 获取认证信息")
@@ -130,110 +389,124 @@ class BrowserAuthHelper:
             # 打开登录页面
             await page.goto(self.config.login_url)
             
-            # 等待用户登录完成
-            input("登录完成后请按 Enter 键...")
+            # 等待用户登录完成（在线程中读取输入，事件循环可继续处理浏览器事件）
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, input, "登录完成后请按 Enter 键...")
+            listening = True
             
-            try:
-                # 访问测试接口以捕获请求头
+            # 登录后页面尚未请求测试接口时，主动访问以捕获请求头
+            if not captured.is_set():
                 print("\n正在捕获请求信息...")
-                try:
-                    await page.goto(self.config.test_endpoint)
-                    await asyncio.sleep(2)
-                except:
-                    pass
-                
-                # 提取 cookie
-                cookies = await context.cookies()
-                cookie_dict = {c['name']: c['value'] for c in cookies}
-                
-                if not cookie_dict:
-                    await browser.close()
-                    return False, "未能获取到 Cookie，请检查是否已登录"
-                
-                # 转换为字符串格式
-                self.cookie_str = "; ".join([f"{k}={v}" for k, v in cookie_dict.items()])
-                
-                # 优先使用捕获的请求头，否则使用页面 headers
-                if captured_request.get('headers'):
-                    self.headers = captured_request['headers']
-                    # 移除不需要的头
-                    for key in ['cookie', 'content-length', 'host']:
-                        self.headers.pop(key, None)
-                else:
-                    self.headers = await self._get_page_headers(page)
-                
-                # 尝试获取用户信息
-                user_info = await self._try_get_user_info(page)
-                
-                await browser.close()
-                
-                if user_info:
-                    print(f"\n检测到用户信息: {user_info}")
-                
-                if captured_request.get('headers'):
-                    print("✓ 已捕获完整请求头")
-                
-                return True, self.cookie_str
-                
+                goto_task = asyncio.create_task(page.goto(self.config.test_endpoint))
+                wait_task = asyncio.create_task(captured.wait())
+                # 捕获到请求头或导航结束即可继续，不再固定等待
+                done, pending = await asyncio.wait(
+                    {goto_task, wait_task}, timeout=5, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                if goto_task in done and not goto_task.cancelled():
+                    goto_task.exception()  # 导航失败不影响 Cookie 提取
+                if not done:
+                    await asyncio.sleep(0.2)
+            
+            return await self._extract_credentials(context, page, captured_request, save_state=True)
+            
+        except Exception as e:
+            return False, f"获取 Cookie 失败: {e}"
+        finally:
+            if page is not None:
+                await page.close()
+    
+    async def _extract_credentials(self, context, page, captured_request: dict, save_state: bool) -> Tuple[bool, str]:
+        """从 context 提取 Cookie，并整理请求头"""
+        # 提取 cookie
+        cookies = await context.cookies()
+        cookie_dict = {c['name']: c['value'] for c in cookies}
+        
+        if not cookie_dict:
+            return False, "未能获取到 Cookie，请检查是否已登录"
+        
+        # 尝试获取用户信息（Cookie 已拿到，页面无需再渲染图片和样式）
+        # 仅作展示用，限时获取；已捕获请求头时不再读取页面，可与后续处理并行
+        await _install_blocklist(page)
+        user_info_task = None
+        if captured_request.get('headers'):
+            user_info_task = asyncio.create_task(self._fetch_user_info(page))
+        
+        # 转换为字符串格式
+        self.cookie_str = "; ".join(f"{k}={v}" for k, v in cookie_dict.items())
+        
+        # 优先使用捕获的请求头，否则使用页面 headers
+        if captured_request.get('headers'):
+            # 移除不需要的头（不区分大小写）
+            self.headers = {
+                k: v for k, v in captured_request['headers'].items()
+                if k.lower() not in _STRIP_HEADERS
+            }
+        else:
+            self.headers = await self._get_page_headers(page)
+        
+        if user_info_task is None:
+            user_info_task = asyncio.create_task(self._fetch_user_info(page))
+        user_info = await user_info_task
+        
+        if user_info:
+            print(f"\n检测到用户信息: {user_info}")
+        
+        if captured_request.get('headers'):
+            print("✓ 已捕获完整请求头")
+        
+        # 保存登录状态，下次认证可跳过登录
+        if save_state:
+            try:
+                _save_storage_state(self.source_name, await context.storage_state())
             except Exception as e:
-                await browser.close()
-                return False, f"获取 Cookie 失败: {e}"
+                print(f"保存登录状态失败: {e}")
+        
+        return True, self.cookie_str
     
     async def _get_page_headers(self, page) -> Dict[str, str]:
         """获取页面请求头信息"""
-        headers = {}
-        try:
-            # 获取 User-Agent
-            headers['User-Agent'] = await page.evaluate('() => navigator.userAgent')
-        except:
-            headers['User-Agent'] = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        # 获取 User-Agent（同一浏览器实例的 UA 不变，只读取一次）
+        user_agent = _PW_SINGLETON["user_agent"]
+        if user_agent is None:
+            try:
+                user_agent = await asyncio.wait_for(page.evaluate('() => navigator.userAgent'), timeout=0.5)
+                _PW_SINGLETON["user_agent"] = user_agent
+            except Exception:
+                user_agent = _DEFAULT_USER_AGENT
         
         # 通用 headers
-        headers['Accept'] = 'application/json, text/plain, */*'
-        headers['Accept-Language'] = 'zh-CN,zh;q=0.9,en;q=0.8'
-        headers['Accept-Encoding'] = 'gzip, deflate, br'
-        headers['Connection'] = 'keep-alive'
-        headers['Sec-Fetch-Dest'] = 'empty'
-        headers['Sec-Fetch-Mode'] = 'cors'
-        headers['Sec-Fetch-Site'] = 'same-site'
+        headers = {'User-Agent': user_agent, **_BASE_HEADERS}
         
         # 根据平台添加特定 headers
-        if self.source_name == 'zhihu':
-            headers['Referer'] = 'https://www.zhihu.com/'
-            headers['x-requested-with'] = 'fetch'
-        elif self.source_name == 'jike':
-            headers['Referer'] = 'https://web.okjike.com/'
-            headers['Origin'] = 'https://web.okjike.com'
+        headers |= _PLATFORM_HEADERS.get(self.source_name, {})
         
         return headers
     
+    async def _fetch_user_info(self, page) -> Optional[str]:
+        """限时获取用户昵称，超时或出错返回 None"""
+        try:
+            return await asyncio.wait_for(self._try_get_user_info(page), timeout=USER_INFO_TIMEOUT)
+        except Exception:
+            return None
+    
     async def _try_get_user_info(self, page) -> Optional[str]:
         """尝试获取用户昵称"""
+        entry = _USER_INFO_TABLE.get(self.source_name)
+        if not entry:
+            return None
+        
+        url, selector = entry
         try:
-            # 知乎
-            if self.source_name == "zhihu":
-                try:
-                    await page.goto("https://www.zhihu.com/people/me")
-                    await asyncio.sleep(1)
-                    name = await page.locator(".ProfileHeader-name").first.text_content(timeout=3000)
-                    return name
-                except:
-                    pass
-            
-            # 即刻
-            elif self.source_name == "jike":
-                try:
-                    await page.goto("https://web.okjike.com/")
-                    await asyncio.sleep(1)
-                    name = await page.locator(".user-name").first.text_content(timeout=3000)
-                    return name
-                except:
-                    pass
-                    
+            await page.goto(url, wait_until="domcontentloaded")
+            locator = page.locator(selector).first
+            await locator.wait_for(state="visible", timeout=3000)
+            return await locator.text_content()
         except:
-            pass
-        
-        return None
+            return None
     
     def get_curl_command(self) -> str:
         """生成完整的 cURL 命令"""
@@ -242,15 +515,14 @@ class BrowserAuthHelper:
         
         url = self.config.test_endpoint if self.config else "https://example.com"
         
-        # 构建完整的 cURL 命令
-        cmd_parts = [f"curl '{url}'"]
-        
-        # 添加 headers
-        for key, value in self.headers.items():
-            cmd_parts.append(f"-H '{key}: {value}'")
-        
-        # 添加 Cookie
-        cmd_parts.append(f"-H 'Cookie: {self.cookie_str}'")
+        # 构建完整的 cURL 命令：URL + headers + Cookie（shlex.quote 处理值中的单引号等字符）
+        cmd_parts = ["curl", shlex.quote(url)]
+        cmd_parts.extend(
+            arg
+            for key, value in self.headers.items()
+            for arg in ("-H", shlex.quote(f"{key}: {value}"))
+        )
+        cmd_parts.extend(("-H", shlex.quote(f"Cookie: {self.cookie_str}")))
         
         return " ".join(cmd_parts)
 
@@ -275,7 +547,6 @@ async def interactive_auth(source_name: str, username: str = None) -> Tuple[bool
         return False, result
     
     # 保存到数据库
-    from src.auth_manager import get_auth_manager
     manager = get_auth_manager()
     
     # 构造 cURL 命令
@@ -1,20 +1,50 @@
 """
 命令行工具
 """
-import asyncio
-import os
-from datetime import datetime, timezone
-from pathlib import Path
+import importlib
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-console = Console()
+from src import __version__
+from src.cli._util import _get_service, _run, _say_ok, get_console, make_table, status_glyph
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+    支持延迟加载子命令的命令组
+    
+    lazy_subcommands: {命令名: "模块路径.属性名"}，命令只在被调用（或显示帮助）时才导入
+    """
+    
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+    
+    def list_commands(self, ctx):
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+    
+    def _lazy_load(self, cmd_name):
+        modname, attr = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+        cmd_object = getattr(importlib.import_module(modname), attr)
+        if not isinstance(cmd_object, click.Command):
+            raise ValueError(f"延迟加载 {self.lazy_subcommands[cmd_name]} 得到的不是 click.Command")
+        return cmd_object
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "auth": "src.cli._cmds.auth.auth",
+        "setup": "src.cli._cmds.setup.setup",
+        "llm": "src.cli._cmds.llm.llm",
+    },
+)
+@click.version_option(__version__, "-v", "--version", message="Daily Agent CLI %(version)s")
 def cli():
     """Daily Agent CLI"""
     pass
@@ -25,19 +55,26 @@ def cli():
 @click.option("--date", "-d", help="日期 (YYYY-MM-DD)")
 def generate(user: str, date: str = None):
     """生成日报"""
+    import datetime
+    import re
+    
+    try:
+        # 只接受 YYYY-MM-DD：date.fromisoformat 也接受 20240115、2024-W03-1 等写法，先校验格式
+        if date and not re.fullmatch(r"\d{4}-\d{2}-\d{2}", date):
+            raise ValueError(date)
+        dt = datetime.datetime.combine(datetime.date.fromisoformat(date), datetime.time()) if date else None
+    except ValueError:
+        raise click.BadParameter(f"日期格式应为 YYYY-MM-DD: {date}", param_hint="'--date'")
+    
     async def _generate():
-        from src.service import DailyAgentService
+        service = await _get_service()
         
-        service = DailyAgentService()
-        await service.initialize()
-        
-        dt = datetime.strptime(date, "%Y-%m-%d") if date else None
         report = await service.generate_daily_report(user_id=user, date=dt)
         
-        console.print(f"[green]日报生成成功:[/green] {report.id}")
-        console.print(f"  总条目: {report.total_items}")
+        click.echo(f"{click.style('日报生成成功:', fg='green')} {report.id}")
+        click.echo(f"  总条目: {report.total_items}")
     
-    asyncio.run(_generate())
+    _run(_generate())
 
 
 @cli.command()
@@ -45,114 +82,103 @@ def generate(user: str, date: str = None):
 @click.option("--channel", "-c", multiple=True, help="推送渠道")
 def push(report_id: str, channel: tuple):
     """推送日报"""
+    console = get_console()
+    
     async def _push():
-        from sqlalchemy.ext.asyncio import AsyncSession
         from src.database import get_session, DailyReportRepository
-        from src.models import DailyReport
-        from src.service import DailyAgentService
         
-        service = DailyAgentService()
-        await service.initialize()
+        service = await _get_service()
         
+        # 会话只覆盖查询本身，推送期间不占用数据库连接
         async with get_session() as session:
-            repo = DailyReportRepository(session)
-            db_report = await repo.get_by_id(report_id)
-            
-            if not db_report:
-                console.print(f"[red]日报不存在: {report_id}[/red]")
-                return
-            
-            report = DailyReport(
-                id=db_report.id,
-                date=db_report.date,
-                user_id=db_report.user_id,
-                title=db_report.title,
-                total_items=db_report.total_items
-            )
-            
-            channels = list(channel) if channel else None
-            results = await service.push_report(report, channels)
-            
-            for ch, result in results.items():
-                status = "[green]✓[/green]" if result.success else "[red]✗[/red]"
-                console.print(f"{status} {ch}: {result.message}")
+            report = await DailyReportRepository(session).get_model_by_id(report_id)
+        
+        if not report:
+            console.print(f"[red]日报不存在: {report_id}[/red]")
+            return
+        
+        results = await service.push_report(report, channel or None)
+        
+        for ch, result in results.items():
+            console.print(status_glyph(result.success), f"{ch}: {result.message}")
     
-    asyncio.run(_push())
+    _run(_push())
+
+
+# 采集结果表格列定义（内容长度固定的列指定宽度，渲染时无需逐行测量）
+_COLLECT_COLUMNS = (
+    ("来源", {"style": "cyan"}),
+    ("状态", {"style": "green", "width": 4}),
+    ("数量", {"justify": "right", "width": 4}),
+    ("消息", {}),
+)
 
 
 @cli.command()
 def collect():
     """手动触发采集"""
+    console = get_console()
+    
     async def _collect():
-        from src.service import DailyAgentService
-        
-        service = DailyAgentService()
-        await service.initialize()
-        
-        results = await service.collect_all()
-        
-        table = Table(title="采集结果")
-        table.add_column("来源", style="cyan")
-        table.add_column("状态", style="green")
-        table.add_column("数量", justify="right")
-        table.add_column("消息")
-        
-        for name, result in results.items():
-            status = "✓" if result.success else "✗"
-            table.add_row(
-                name,
-                status,
-                str(len(result.items)),
-                result.message[:50]
-            )
-        
-        console.print(table)
+        from rich.live import Live
+        
+        service = await _get_service()
+        table = make_table(_COLLECT_COLUMNS, title="采集结果")
+        
+        # 每个来源完成即追加一行，无需等待最慢的来源
+        with Live(table, console=console, refresh_per_second=4):
+            async for name, result in service.collect_iter():
+                table.add_row(
+                    name,
+                    status_glyph(result.success),
+                    str(len(result.items)),
+                    result.message[:50]
+                )
     
-    asyncio.run(_collect())
+    _run(_collect())
 
 
 @cli.command()
 def verify():
     """验证配置"""
-    from src.config import get_settings, get_column_config
+    from src.config import COLUMN_CONFIG_ERRORS, get_settings, get_column_config
+    console = get_console()
     
     settings = get_settings()
     col_config = get_column_config()
     
-    console.print("[bold]配置验证[/bold]\n")
+    # 先收集全部输出行，最后一次性渲染输出
+    lines = ["[bold]配置验证[/bold]\n"]
     
     # 检查 LLM
     llm_status = "✓" if settings.openai_api_key else "✗"
-    console.print(f"{llm_status} LLM 配置: {'已配置' if settings.openai_api_key else '未配置'}")
+    lines.append(f"{llm_status} LLM 配置: {'已配置' if settings.openai_api_key else '未配置'}")
     
     # 检查推送渠道
-    channels = []
-    if settings.telegram_bot_token:
-        channels.append("Telegram")
-    if settings.slack_bot_token:
-        channels.append("Slack")
-    if settings.discord_bot_token:
-        channels.append("Discord")
+    channels = settings.configured_channels()
     
     if channels:
-        console.print(f"✓ 推送渠道: {', '.join(channels)}")
+        lines.append(f"✓ 推送渠道: {', '.join(channels)}")
     else:
-        console.print("✗ 推送渠道: 未配置")
+        lines.append("✗ 推送渠道: 未配置")
     
     # 检查分栏配置
     try:
         columns = col_config.get_columns()
-        console.print(f"✓ 分栏配置: {len(columns)} 个分栏")
-        for col in columns:
-            console.print(f"  • {col.get('name')} ({len(col.get('sources', []))} 个源)")
-    except Exception as e:
-        console.print(f"✗ 分栏配置错误: {e}")
+        lines.append(f"✓ 分栏配置: {len(columns)} 个分栏")
+        lines.extend(f"  • {col.get('name')} ({len(col.get('sources', []))} 个源)" for col in columns)
+    except COLUMN_CONFIG_ERRORS as e:
+        lines.append(f"✗ 分栏配置错误: {e}")
+    
+    console.print("\n".join(lines))
 
 
 @cli.command()
 def setup_telegram():
     """配置 Telegram Bot"""
+    from pathlib import Path
     from rich.prompt import Prompt
+    console = get_console()
     
     console.print("""
 [bold blue]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold blue]
@@ -240,6 +266,7 @@ def setup_telegram():
     # 测试连接
     console.print("\n[bold]步骤 3: 测试连接[/bold]\n")
     
+    error = None
     with console.status("[bold green]正在测试..."):
         try:
             response = httpx.post(
@@ -252,19 +279,19 @@ def setup_telegram():
                 timeout=10.0
             )
             data = response.json()
-            
-            if data.get("ok"):
-                console.print("[green]✓ 连接测试成功！[/green]")
-                console.print("  已发送测试消息到您的 Telegram")
-            else:
-                console.print(f"[red]✗ 测试失败: {data.get('description')}[/red]")
-                if not Confirm.ask("是否仍要保存配置?", default=False):
-                    return
-        
+            if not data.get("ok"):
+                error = data.get("description") or f"HTTP {response.status_code}"
         except Exception as e:
-            console.print(f"[red]✗ 测试失败: {e}[/red]")
-            if not Confirm.ask("是否仍要保存配置?", default=False):
-                return
+            error = e
+    
+    # 确认提示放在 status 之外，避免与加载动画争用终端
+    if error is None:
+        console.print("[green]✓ 连接测试成功！[/green]")
+        console.print("  已发送测试消息到您的 Telegram")
+    else:
+        console.print(f"[red]✗ 测试失败: {error}[/red]")
+        if not click.confirm("是否仍要保存配置?", default=False):
+            return
     
     # 保存配置
     console.print("\n[bold]步骤 4: 保存配置[/bold]\n")
@@ -292,6 +319,10 @@ def setup_telegram():
         for key, value in env_content.items():
             f.write(f"{key}={value}\n")
     
+    # 清除 settings 缓存，确保重新加载配置
+    from src.config import get_settings
+    get_settings.cache_clear()
+    
     console.print("[green]✓ 配置已保存到 .env 文件[/green]\n")
     console.print("[bold]使用命令:[/bold]")
     console.print("  [cyan]python -m src.cli send telegram[/cyan]  - 发送最新日报到 Telegram")
@@ -303,12 +334,16 @@ def setup_telegram():
 @click.option("--template", "-t", help="使用预设模板")
 def start(mode: str, template: str):
     """启动 Daily Agent 服务"""
-    async def _init_and_setup():
-        """初始化数据库和配置（异步部分）"""
-        from src.database import init_db
+    console = get_console()
+    
+    def _select_mode():
+        """确定启动模式（仅文件检查和终端输入，无需事件循环）"""
+        from pathlib import Path
+        from src.config import get_settings
         
-        # 检查是否首次启动
-        is_first_run = not os.path.exists("data/daily.db")
+        # 检查是否首次启动（数据库文件取自配置的 SQLite URL，与工作目录无关）
+        db_path = get_settings().database_url.split(":///", 1)[-1]
+        is_first_run = not Path(db_path).is_file()
         
         if is_first_run and not mode:
             # 首次启动，交互式选择模式
@@ -332,9 +367,8 @@ def start(mode: str, template: str):
       • LLM 智能摘要
       • 推送渠道设置
       • 完整能力体验
-
-请选择 [1-2]: """)
-            choice = input().strip()
+""")
+            choice = click.prompt("请选择", type=click.Choice(["1", "2"]), default="1")
             return "fast" if choice == "1" else "configure"
         return mode
     
@@ -355,10 +389,11 @@ def start(mode: str, template: str):
             
             # 如果有模板，应用模板
             if template:
-                from src.setup_wizard import SetupWizard
-                wizard = SetupWizard()
-                await wizard.apply_template(template)
-                console.print(f"  ✓ 应用模板: {template}")
+                from src.setup_wizard import apply_template
+                if await apply_template(template):
+                    console.print(f"  ✓ 应用模板: {template}")
+                else:
+                    console.print(f"  [yellow]⚠ 未知模板: {template}[/yellow]")
             
             console.print("""
   ✓ 数据库初始化完成
@@ -387,11 +422,11 @@ def start(mode: str, template: str):
             await wizard.run_full_setup()
     
     # 第一步：交互式选择模式（如果需要）
-    selected_mode = asyncio.run(_init_and_setup())
+    selected_mode = _select_mode()
     
-    # 第二步：运行设置
-    if selected_mode:
-        asyncio.run(_run_setup(selected_mode))
+    # 第二步：运行设置（只指定模板时按 Fast 模式处理）
+    if selected_mode or template:
+        _run(_run_setup(selected_mode))
     
     # 第三步：启动服务（同步方式，避免 asyncio.run 嵌套）
     import uvicorn
@@ -410,581 +445,106 @@ def start(mode: str, template: str):
 @cli.command()
 def status():
     """查看系统状态"""
+    console = get_console()
+    
     async def _status():
-        from src.config import get_settings, get_column_config
+        import asyncio
+        from sqlalchemy.exc import SQLAlchemyError
+        from src.config import COLUMN_CONFIG_ERRORS, get_settings, get_column_config
         from src.database import get_session, DailyReportRepository, ContentRepository
-        from datetime import datetime, timedelta
+        from datetime import datetime, timezone
         
         settings = get_settings()
         
-        console.print("""
+        # 先收集全部输出行，最后一次性渲染输出
+        lines = ["""
 🤖 Daily Agent 状态
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        """)
+        """]
         
         # 服务状态
-        console.print("[bold]服务状态:[/bold]")
-        console.print(f"  应用名称: {settings.app_name}")
-        console.print(f"  调试模式: {'开启' if settings.debug else '关闭'}")
-        console.print(f"  监听地址: {settings.host}:{settings.port}")
+        lines += [
+            "[bold]服务状态:[/bold]",
+            f"  应用名称: {settings.app_name}",
+            f"  调试模式: {'开启' if settings.debug else '关闭'}",
+            f"  监听地址: {settings.host}:{settings.port}",
+        ]
         
         # 配置状态
-        console.print("\n[bold]配置状态:[/bold]")
+        lines.append("\n[bold]配置状态:[/bold]")
         
         # LLM
         llm_status = "✅ 已配置" if settings.openai_api_key else "⚪ 未配置"
-        console.print(f"  LLM: {llm_status}")
+        lines.append(f"  LLM: {llm_status}")
         
         # 推送渠道
-        channels = []
-        if settings.telegram_bot_token:
-            channels.append("Telegram")
-        if settings.slack_bot_token:
-            channels.append("Slack")
-        if settings.discord_bot_token:
-            channels.append("Discord")
-        if settings.smtp_host:
-            channels.append("Email")
+        channels = settings.configured_channels()
         
         channel_status = ", ".join(channels) if channels else "⚪ 未配置"
-        console.print(f"  推送渠道: {channel_status}")
+        lines.append(f"  推送渠道: {channel_status}")
         
         # 分栏配置
         try:
             col_config = get_column_config()
             columns = col_config.get_columns()
-            console.print(f"  日报分栏: {len(columns)} 个")
-        except:
-            console.print("  日报分栏: ⚪ 未配置")
+            lines.append(f"  日报分栏: {len(columns)} 个")
+        except COLUMN_CONFIG_ERRORS:
+            lines.append("  日报分栏: ⚪ 未配置")
         
         # 今日统计
-        console.print("\n[bold]今日统计:[/bold]")
-        try:
-            async with get_session() as session:
-                content_repo = ContentRepository(session)
-                report_repo = DailyReportRepository(session)
-                
-                today = datetime.now(timezone.utc).date()
-                yesterday = today - timedelta(days=1)
-                
-                # 获取今日采集数量
-                daily_items = await content_repo.get_by_date(yesterday, today)
-                console.print(f"  采集内容: {len(daily_items)} 条")
-                
-                # 获取今日日报
-                today_report = await report_repo.get_by_date("default", datetime.now(timezone.utc))
-                if today_report:
-                    console.print(f"  生成日报: 1 份 ({today_report.total_items} 条内容)")
-                    console.print(f"  推送状态: {'已推送' if today_report.is_sent else '未推送'}")
-                else:
-                    console.print("  生成日报: 0 份")
-        except Exception as e:
-            console.print(f"  统计信息: 暂不可用 ({e})")
-        
-        console.print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    
-    asyncio.run(_status())
-
-
-@cli.command()
-def init():
-    """初始化数据库"""
-    async def _init():
-        from src.database import init_db
-        await init_db()
-        console.print("[green]数据库初始化完成[/green]")
-    
-    asyncio.run(_init())
-
-
-# ============ 认证管理命令 ============
-
-@cli.group()
-def auth():
-    """认证管理 - 管理需要登录的信息渠道"""
-    pass
-
-
-@auth.command("list")
-def auth_list():
-    """列出所有已配置的认证"""
-    async def _list():
-        from src.auth_manager import get_auth_manager
+        lines.append("\n[bold]今日统计:[/bold]")
+        now = datetime.now(timezone.utc)
         
-        manager = get_auth_manager()
-        credentials = await manager.list_auth()
-        
-        if not credentials:
-            console.print("[yellow]暂无认证配置[/yellow]")
-            console.print("\n使用 [cyan]python -m src.cli auth add <渠道名>[/cyan] 添加认证")
-            console.print("\n支持的渠道:")
-            for key, config in manager.get_supported_sources().items():
-                console.print(f"  • [green]{key}[/green] - {config.display_name}")
-            return
+        # 两个查询各用独立会话（同一 AsyncSession 不支持并发执行），并发等待
+        async def _daily_count():
+            async with get_session() as session:
+                return await ContentRepository(session).count_by_date(now)
         
-        table = Table(title="已配置的认证")
-        table.add_column("渠道", style="cyan")
-        table.add_column("认证方式", style="blue")
-        table.add_column("用户信息", style="green")
-        table.add_column("过期时间", style="yellow")
-        table.add_column("状态", style="bold")
+        async def _today_report():
+            async with get_session() as session:
+                return await DailyReportRepository(session).get_by_date("default", now)
         
-        for cred in credentials:
-            expires = cred["expires_at"].strftime("%Y-%m-%d %H:%M") if cred["expires_at"] else "未知"
-            
-            # 计算状态
-            if not cred["is_valid"]:
-                status = "[red]✗ 失效[/red]"
-            elif cred["expires_at"] and cred["expires_at"] < datetime.now(timezone.utc):
-                status = "[red]✗ 已过期[/red]"
-            elif cred["expires_at"] and (cred["expires_at"] - datetime.now(timezone.utc)).days <= 3:
-                status = "[yellow]⚠ 即将过期[/yellow]"
-            else:
-                status = "[green]✓ 有效[/green]"
-            
-            user_info = cred["username"] or "-"
+        try:
+            daily_count, today_report = await asyncio.gather(_daily_count(), _today_report())
             
-            table.add_row(
-                f"{cred['display_name']}\n[cyan]({cred['source_name']})[/cyan]",
-                cred["auth_type"],
-                user_info,
-                expires,
-                status
-            )
-        
-        console.print(table)
-    
-    asyncio.run(_list())
-
-
-@auth.command("add")
-@click.argument("source_name")
-@click.option("--username", "-u", help="用户名（可选）")
-@click.option("--browser", "-b", is_flag=True, help="使用浏览器自动获取（推荐）")
-@click.option("--manual", "-m", is_flag=True, help="手动粘贴 cURL")
-def auth_add(source_name: str, username: str = None, browser: bool = False, manual: bool = False):
-    """添加认证配置"""
-    from src.auth_manager import get_auth_manager, AUTH_CONFIGS
-    
-    manager = get_auth_manager()
-    config = manager.get_config(source_name)
-    
-    if not config:
-        click.echo(f"不支持的渠道: {source_name}")
-        click.echo("\n支持的渠道:")
-        for key, cfg in AUTH_CONFIGS.items():
-            click.echo(f"  • {key} - {cfg.display_name}")
-        return
-    
-    # 选择方式
-    if not browser and not manual:
-        click.echo(f"\n{'='*60}")
-        click.echo(f"正在为 [{config.display_name}] 配置认证信息")
-        click.echo(f"{'='*60}\n")
-        click.echo("请选择获取方式:")
-        click.echo("  [1] 🌐 浏览器自动获取（推荐）- 自动登录并提取 Cookie")
-        click.echo("  [2] 📋 手动粘贴 cURL - 从浏览器开发者工具复制")
-        choice = click.prompt("请选择", type=str, default="1")
-        browser = choice == "1"
-        manual = choice == "2"
-    
-    if browser:
-        # 浏览器自动获取
-        _auth_add_browser(source_name, username)
-    else:
-        # 手动粘贴
-        _auth_add_manual(source_name, username)
-
-
-def _auth_add_browser(source_name: str, username: str = None):
-    """使用浏览器自动获取 Cookie"""
-    async def _run():
-        from src.browser_auth import interactive_auth
-        success, message = await interactive_auth(source_name, username)
-        if success:
-            click.echo(f"\n✓ {message}")
-        else:
-            click.echo(f"\n✗ {message}")
-    
-    asyncio.run(_run())
-
-
-def _auth_add_manual(source_name: str, username: str = None):
-    """手动粘贴 cURL"""
-    from src.auth_manager import get_auth_manager
-    
-    manager = get_auth_manager()
-    config = manager.get_config(source_name)
-    
-    click.echo("\n" + "-"*40)
-    click.echo(config.help_text)
-    click.echo("-"*40)
-    click.echo("\n请粘贴 cURL 命令或 Cookie 字符串:")
-    
-    try:
-        curl_command = input("> ").strip()
-    except (EOFError, KeyboardInterrupt):
-        click.echo("\n已取消")
-        return
-    
-    curl_command = curl_command.replace("\\", "")
-    
-    if not curl_command:
-        click.echo("输入为空，取消配置")
-        return
-    
-    async def _save_and_test():
-        click.echo("正在保存...")
-        success, message = await manager.add_auth(source_name, curl_command, username)
-        
-        if success:
-            click.echo(f"✓ {message}")
+            # 今日采集数量
+            lines.append(f"  采集内容: {daily_count} 条")
             
-            # 对严格反爬平台，跳过 HTTP 测试（避免 406）
-            if source_name in ['douyin']:
-                click.echo("✓ Cookie 已保存（适合配合浏览器采集器使用）")
+            # 今日日报
+            if today_report:
+                lines.append(f"  生成日报: 1 份 ({today_report.total_items} 条内容)")
+                lines.append(f"  推送状态: {'已推送' if today_report.is_sent else '未推送'}")
             else:
-                click.echo("正在测试...")
-                is_valid, test_msg, _ = await manager.test_auth(source_name)
-                if is_valid:
-                    click.echo(f"✓ 测试通过")
-                else:
-                    click.echo(f"⚠ 测试未通过: {test_msg}")
-        else:
-            click.echo(f"✗ {message}")
-    
-    asyncio.run(_save_and_test())
-
-
-@auth.command("update")
-@click.argument("source_name")
-@click.option("--username", "-u", help="用户名（可选）")
-def auth_update(source_name: str, username: str = None):
-    """更新认证配置"""
-    # 复用 add 逻辑
-    async def _update():
-        from src.auth_manager import get_auth_manager
-        
-        manager = get_auth_manager()
-        config = manager.get_config(source_name)
-        
-        if not config:
-            console.print(f"[red]不支持的渠道: {source_name}[/red]")
-            return
-        
-        # 检查现有配置
-        from src.database import get_session, AuthCredentialRepository
-        async with get_session() as session:
-            repo = AuthCredentialRepository(session)
-            existing = await repo.get_by_source(source_name)
-        
-        if existing:
-            console.print(f"[blue]当前配置将于 {existing.expires_at.strftime('%Y-%m-%d %H:%M')} 过期[/blue]\n")
-        
-        # 调用 add 逻辑
-        await auth_add.callback(source_name, username)
-    
-    asyncio.run(_update())
-
-
-@auth.command("remove")
-@click.argument("source_name")
-@click.confirmation_option(prompt="确定要删除此认证配置吗?")
-def auth_remove(source_name: str):
-    """删除认证配置"""
-    async def _remove():
-        from src.auth_manager import get_auth_manager
-        
-        manager = get_auth_manager()
-        success, message = await manager.remove_auth(source_name)
+                lines.append("  生成日报: 0 份")
+        except SQLAlchemyError as e:
+            lines.append(f"  统计信息: 暂不可用 ({getattr(e, 'orig', None) or e})")
         
-        if success:
-            console.print(f"[green]{message}[/green]")
-        else:
-            console.print(f"[red]{message}[/red]")
+        lines.append("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        console.print("\n".join(lines))
     
-    asyncio.run(_remove())
+    _run(_status())
 
 
-@auth.command("test")
-@click.argument("source_name")
-def auth_test(source_name: str):
-    """测试认证是否有效"""
-    async def _test():
-        from src.auth_manager import get_auth_manager
-        
-        manager = get_auth_manager()
-        config = manager.get_config(source_name)
-        
-        if not config:
-            console.print(f"[red]不支持的渠道: {source_name}[/red]")
-            return
-        
-        console.print(f"[bold]测试 [{config.display_name}] 认证状态...[/bold]\n")
-        
-        with console.status("[bold green]正在测试认证..."):
-            is_valid, message, user_info = await manager.test_auth(source_name)
-        
-        if is_valid:
-            console.print(f"[green]✓ 认证有效[/green]")
-            if user_info:
-                if user_info.get("username"):
-                    console.print(f"  用户名: [cyan]{user_info['username']}[/cyan]")
-                if user_info.get("user_id"):
-                    console.print(f"  用户ID: [dim]{user_info['user_id']}[/dim]")
-        else:
-            console.print(f"[red]✗ {message}[/red]")
-    
-    asyncio.run(_test())
-
-
-@auth.command("guide")
-def auth_guide():
-    """显示认证配置指南"""
-    from src.auth_manager import AUTH_CONFIGS
-    
-    console.print("[bold blue]认证配置指南[/bold blue]\n")
-    console.print("以下渠道需要登录认证才能采集个性化内容:\n")
-    
-    for key, config in AUTH_CONFIGS.items():
-        console.print(Panel(
-            f"[bold]{config.display_name}[/bold] ([cyan]{key}[/cyan])\n"
-            f"[dim]认证方式:[/dim] {config.auth_type}\n"
-            f"[dim]默认有效期:[/dim] {config.expires_days} 天\n\n"
-            f"{config.help_text}",
-            border_style="green"
-        ))
-    
-    console.print("\n[bold]常用命令:[/bold]")
-    console.print("  [cyan]python -m src.cli auth list[/cyan]     - 查看已配置的认证")
-    console.print("  [cyan]python -m src.cli auth add jike[/cyan] - 添加即刻认证")
-    console.print("  [cyan]python -m src.cli auth test jike[/cyan] - 测试即刻认证")
-
-
-# ============ 启动设置向导命令 ============
-
-@cli.group(invoke_without_command=True)
-@click.option("--all", "all_modules", is_flag=True, help="完整重新配置所有模块")
-@click.option("--module", "module_name", type=click.Choice(["profile", "interests", "daily", "llm", "channels"]), help="仅配置特定模块")
-@click.option("--mode", type=click.Choice(["fast", "configure"]), help="启动模式")
-@click.option("--template", help="使用预设模板")
-@click.pass_context
-def setup(ctx, all_modules: bool, module_name: str, mode: str, template: str):
-    """启动设置向导 - 配置用户画像、兴趣和日报"""
-    if ctx.invoked_subcommand is not None:
-        return
-    
-    async def _setup():
-        # 如果指定了模式，执行对应的启动流程
-        if mode == "fast":
-            console.print("⚡ Fast 模式启动...")
-            if template:
-                from src.setup_wizard import apply_template
-                await apply_template(template)
-                console.print(f"✓ 应用模板: {template}")
-            console.print("✅ Fast 模式配置完成！")
-            return
-        
-        elif mode == "configure" or all_modules or module_name:
-            from src.setup_wizard import SetupWizard
-            wizard = SetupWizard()
-            
-            if all_modules:
-                await wizard.run_full_setup()
-            elif module_name:
-                # 仅配置特定模块
-                if module_name == "profile":
-                    wizard.profile_config = await wizard._setup_profile()
-                    await wizard._save_config()
-                elif module_name == "interests":
-                    wizard.interest_config = await wizard._setup_interests()
-                    await wizard._save_config()
-                elif module_name == "daily":
-                    wizard.daily_config = await wizard._setup_daily_report()
-                    await wizard._save_daily_config()
-                elif module_name == "llm":
-                    await wizard._setup_llm()
-                console.print(f"✅ {module_name} 模块配置完成！")
-            else:
-                await wizard.run_full_setup()
-            return
-        
-        # 默认运行完整向导
-        from src.setup_wizard import SetupWizard
-        wizard = SetupWizard()
-        await wizard.run_full_setup()
-    
-    asyncio.run(_setup())
-
-
-@setup.command("wizard")
-@click.option("--user", "-u", default="default", help="用户 ID")
-def setup_wizard(user: str):
-    """运行完整设置向导"""
-    async def _wizard():
-        from src.setup_wizard import SetupWizard
-        
-        wizard = SetupWizard(user_id=user)
-        await wizard.run_full_setup()
-    
-    asyncio.run(_wizard())
-
-
-@setup.command("export")
-@click.option("--user", "-u", default="default", help="用户 ID")
-@click.option("--format", "-f", type=click.Choice(["yaml", "json"]), default="yaml", help="导出格式")
-@click.option("--output", "-o", help="输出文件路径")
-def setup_export(user: str, format: str, output: str):
-    """导出用户配置"""
-    async def _export():
-        from src.setup_wizard import export_config
-        
-        try:
-            filepath = await export_config(user_id=user, format=format, output=output)
-            console.print(f"[green]✅ 配置已导出到: {filepath}[/green]")
-        except ValueError as e:
-            console.print(f"[red]✗ {e}[/red]")
-    
-    asyncio.run(_export())
-
-
-@setup.command("import")
-@click.argument("filepath")
-@click.option("--user", "-u", default="default", help="用户 ID")
-@click.option("--force", "-f", is_flag=True, help="强制覆盖现有配置")
-def setup_import(filepath: str, user: str, force: bool):
-    """导入用户配置"""
-    async def _import():
-        from src.setup_wizard import import_config
-        
-        try:
-            success = await import_config(filepath, user_id=user, overwrite=force)
-            if success:
-                console.print(f"[green]✅ 配置导入成功[/green]")
-            else:
-                console.print(f"[yellow]⚠️ 用户已有配置，使用 --force 覆盖[/yellow]")
-        except Exception as e:
-            console.print(f"[red]✗ 导入失败: {e}[/red]")
-    
-    asyncio.run(_import())
-
-
-@setup.command("templates")
-def setup_templates():
-    """查看可用配置模板"""
-    from src.setup_wizard import PROFILE_TEMPLATES
-    
-    console.print("[bold blue]可用配置模板[/bold blue]\n")
-    
-    table = Table()
-    table.add_column("模板ID", style="cyan")
-    table.add_column("名称", style="green")
-    table.add_column("描述")
-    table.add_column("阅读时间")
-    
-    for key, template in PROFILE_TEMPLATES.items():
-        table.add_row(
-            key,
-            template.name,
-            template.description,
-            f"{template.daily_time_minutes} 分钟"
-        )
-    
-    console.print(table)
-    
-    console.print("\n[bold]使用模板快速设置：[/bold]")
-    console.print("  [cyan]python -m src.cli setup wizard[/cyan]  - 启动向导并选择模板")
-
-
-@setup.command("expert")
-def setup_expert():
-    """专家模式 - LLM 辅助配置（推荐深度定制用户）"""
-    async def _expert():
-        from src.expert_setup import run_expert_setup
-        await run_expert_setup()
-
-    asyncio.run(_expert())
-
-
-# ============ LLM 配置命令 ============
-
-@cli.group()
-def llm():
-    """LLM 配置管理 - 配置大语言模型"""
-    pass
-
-
-@llm.command("setup")
-def llm_setup():
-    """启动 LLM 配置向导"""
-    async def _setup():
-        from src.llm_config import LLMSetupWizard
-        
-        wizard = LLMSetupWizard()
-        await wizard.run_setup()
-    
-    asyncio.run(_setup())
-
-
-@llm.command("status")
-def llm_status():
-    """查看 LLM 配置状态"""
-    from src.llm_config import LLMSetupWizard
-    
-    wizard = LLMSetupWizard()
-    wizard.print_status()
-
-
-@llm.command("test")
-def llm_test():
-    """测试 LLM 连接"""
-    async def _test():
-        from src.llm_config import get_llm_manager
-        
-        manager = get_llm_manager()
-        config = manager.get_current_config()
-        
-        if not config.is_configured():
-            console.print("[yellow]⚠️ 尚未配置 LLM，请先运行: python -m src.cli llm setup[/yellow]")
-            return
-        
-        console.print("[bold]🧪 正在测试 LLM 连接...[/bold]\n")
-        
-        with console.status("[bold green]测试中..."):
-            success, message = await manager.test_connection()
-        
-        if success:
-            console.print(f"[green]✅ {message}[/green]")
-        else:
-            console.print(f"[red]✗ {message}[/red]")
-    
-    asyncio.run(_test())
-
-
-@llm.command("switch")
-def llm_switch():
-    """切换 LLM 模型"""
-    async def _switch():
-        from src.llm_config import LLMSetupWizard
-        
-        wizard = LLMSetupWizard()
-        await wizard.switch_model()
-    
-    asyncio.run(_switch())
-
-
-@llm.command("models")
-def llm_models():
-    """查看支持的模型列表"""
-    from src.llm_config import LLMSetupWizard
+@cli.command()
+def init():
+    """初始化数据库"""
+    from src.database import init_db
     
-    wizard = LLMSetupWizard()
-    wizard.print_models()
+    # 显式初始化总是执行建表，可补建缺失的表
+    _run(init_db(force=True))
+    _say_ok("数据库初始化完成")
 
 
 # ============ 配置管理命令 ============
 
-@cli.group()
+# 导出/导入与 setup 组共用同一命令对象
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "export": "src.cli._cmds.setup.setup_export",
+        "import": "src.cli._cmds.setup.setup_import",
+    },
+)
 def config():
     """配置管理 - 查看、导出、导入配置"""
     pass
@@ -995,7 +555,10 @@ def config():
 @click.option("--format", "-f", type=click.Choice(["yaml", "json"]), default="yaml", help="输出格式")
 def config_show(user: str, format: str):
     """查看当前配置"""
+    console = get_console()
+    
     async def _show():
+        from rich.panel import Panel
         from src.setup_wizard import get_user_config
         
         try:
@@ -1003,7 +566,8 @@ def config_show(user: str, format: str):
             
             if format == "yaml":
                 import yaml
-                output = yaml.dump(user_config, allow_unicode=True, sort_keys=False)
+                from src.config import YamlDumper
+                output = yaml.dump(user_config, Dumper=YamlDumper, allow_unicode=True, sort_keys=False)
             else:
                 import json
                 output = json.dumps(user_config, indent=2, ensure_ascii=False)
@@ -1012,67 +576,31 @@ def config_show(user: str, format: str):
         except Exception as e:
             console.print(f"[yellow]⚠️ 尚未配置，请运行: python -m src.cli setup wizard[/yellow]")
     
-    asyncio.run(_show())
-
-
-@config.command("export")
-@click.option("--user", "-u", default="default", help="用户 ID")
-@click.option("--format", "-f", type=click.Choice(["yaml", "json"]), default="yaml", help="导出格式")
-@click.option("--output", "-o", help="输出文件路径")
-def config_export(user: str, format: str, output: str):
-    """导出用户配置"""
-    async def _export():
-        from src.setup_wizard import export_config
-        
-        try:
-            filepath = await export_config(user_id=user, format=format, output=output)
-            console.print(f"[green]✅ 配置已导出到: {filepath}[/green]")
-        except ValueError as e:
-            console.print(f"[red]✗ {e}[/red]")
-    
-    asyncio.run(_export())
-
-
-@config.command("import")
-@click.argument("filepath")
-@click.option("--user", "-u", default="default", help="用户 ID")
-@click.option("--force", "-f", is_flag=True, help="强制覆盖现有配置")
-def config_import(filepath: str, user: str, force: bool):
-    """导入用户配置"""
-    async def _import():
-        from src.setup_wizard import import_config
-        
-        try:
-            success = await import_config(filepath, user_id=user, overwrite=force)
-            if success:
-                console.print(f"[green]✅ 配置导入成功[/green]")
-            else:
-                console.print(f"[yellow]⚠️ 用户已有配置，使用 --force 覆盖[/yellow]")
-        except Exception as e:
-            console.print(f"[red]✗ 导入失败: {e}[/red]")
-    
-    asyncio.run(_import())
+    _run(_show())
 
 
 @config.command("validate")
 @click.option("--config-file", "-c", help="配置文件路径（验证外部配置）")
 def config_validate(config_file: str):
     """验证配置有效性"""
+    console = get_console()
+    
     console.print("[bold]配置验证[/bold]\n")
     
     if config_file:
         # 验证外部配置文件
         try:
             import yaml
+            from src.config import YamlLoader
             with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YamlLoader)
             console.print(f"[green]✅ 配置文件格式正确[/green]")
             console.print(f"  包含键: {', '.join(config.keys())}")
         except Exception as e:
             console.print(f"[red]✗ 配置文件错误: {e}[/red]")
     else:
         # 验证当前配置
-        from src.config import get_settings, get_column_config
+        from src.config import COLUMN_CONFIG_ERRORS, get_settings, get_column_config
         
         settings = get_settings()
         col_config = get_column_config()
@@ -1093,7 +621,7 @@ def config_validate(config_file: str):
                 for col in columns:
                     if not col.get('sources'):
                         warnings.append(f"分栏 '{col.get('name')}' 没有配置数据源")
-        except Exception as e:
+        except COLUMN_CONFIG_ERRORS as e:
             errors.append(f"分栏配置错误: {e}")
         
         # 输出结果
@@ -1116,18 +644,19 @@ def config_validate(config_file: str):
 @click.confirmation_option(prompt="确定要重置配置吗？这将删除所有用户设置")
 def config_reset(user: str):
     """重置用户配置"""
+    
     async def _reset():
-        from src.database import get_session
-        from sqlalchemy import text
+        from sqlalchemy import delete
+        from src.database import UserFeedbackDB, UserProfileDB, get_session
         
+        # 两条删除在同一事务中执行，由 get_session 退出时统一提交
         async with get_session() as session:
-            # 删除用户相关数据
-            await session.execute(text("DELETE FROM user_profiles WHERE user_id = :user_id"), {"user_id": user})
-            await session.execute(text("DELETE FROM user_feedbacks WHERE user_id = :user_id"), {"user_id": user})
-            await session.commit()
-            console.print(f"[green]✅ 用户 {user} 的配置已重置[/green]")
+            for model in (UserProfileDB, UserFeedbackDB):
+                await session.execute(delete(model).where(model.user_id == user))
+        
+        _say_ok(f"✅ 用户 {user} 的配置已重置")
     
-    asyncio.run(_reset())
+    _run(_reset())
 
 
 @config.command("edit")
@@ -1136,6 +665,8 @@ def config_edit(file: str):
     """使用编辑器打开配置文件"""
     import os
     import subprocess
+    import sys
+    console = get_console()
     
     # 确定文件路径
     if file == "columns":
@@ -1180,35 +711,41 @@ def config_edit(file: str):
 @config.command("sources")
 def config_sources():
     """列出所有配置的数据源"""
+    from rich.console import Group
+    from rich.text import Text
     from src.config import get_column_config
+    console = get_console()
     
     try:
         col_config = get_column_config()
         columns = col_config.get_columns(enabled_only=False)
         
-        console.print("[bold]配置的数据源列表[/bold]\n")
+        # 先组装全部输出，最后一次性渲染
+        parts = ["[bold]配置的数据源列表[/bold]\n"]
         
         for col in columns:
             col_id = col.get("id")
             col_name = col.get("name")
             enabled = col.get("enabled", True)
             
-            status = "[green]✓[/green]" if enabled else "[red]✗[/red]"
-            console.print(f"{status} [bold]{col_name}[/bold] ([dim]{col_id}[/dim])")
+            parts.append(Text.assemble(
+                status_glyph(enabled), " ", console.render_str(f"[bold]{col_name}[/bold] ([dim]{col_id}[/dim])")
+            ))
             
             sources = col.get("sources", [])
             for source in sources:
                 source_name = source.get("name", "unnamed")
                 source_type = source.get("type", "unknown")
-                console.print(f"    • {source_name} ([dim]{source_type}[/dim])")
+                parts.append(f"    • {source_name} ([dim]{source_type}[/dim])")
             
-            console.print()
+            parts.append("")
         
         # 统计
         total_sources = sum(len(c.get("sources", [])) for c in columns)
         enabled_cols = sum(1 for c in columns if c.get("enabled", True))
         
-        console.print(f"[dim]总计: {len(columns)} 个分栏 ({enabled_cols} 个启用), {total_sources} 个数据源[/dim]")
+        parts.append(f"[dim]总计: {len(columns)} 个分栏 ({enabled_cols} 个启用), {total_sources} 个数据源[/dim]")
+        console.print(Group(*parts))
     
     except Exception as e:
         console.print(f"[red]加载配置失败: {e}[/red]")
@@ -1230,17 +767,15 @@ def doctor(auto_fix: bool):
             report = DoctorReport(checker)
             report.print_report()
     
-    asyncio.run(_doctor())
+    _run(_doctor())
 
 
 @cli.command()
 def fix():
     """自动修复系统问题"""
-    async def _fix():
-        from src.doctor import fix_issues
-        await fix_issues()
+    from src.doctor import fix_issues
     
-    asyncio.run(_fix())
+    _run(fix_issues())
 
 
 # ============ 日报管理命令 ============
@@ -1251,12 +786,24 @@ def reports():
     pass
 
 
+# 日报列表表格列定义（内容长度固定的列指定宽度，渲染时无需逐行测量）
+_REPORTS_LIST_COLUMNS = (
+    ("日期", {"style": "cyan", "width": 10}),
+    ("标题", {"style": "green"}),
+    ("内容数", {"justify": "right", "width": 6}),
+    ("状态", {"style": "yellow", "width": 6}),
+    ("操作", {"width": 13}),
+)
+
+
 @reports.command("list")
 @click.option("--user", "-u", default="default", help="用户 ID")
 @click.option("--limit", "-l", default=10, help="显示数量")
 @click.option("--format", "-f", type=click.Choice(["table", "json"]), default="table", help="输出格式")
 def reports_list(user: str, limit: int, format: str):
     """列出历史日报"""
+    console = get_console()
+    
     async def _list():
         from src.database import get_session, DailyReportRepository
         
@@ -1294,12 +841,7 @@ def reports_list(user: str, limit: int, format: str):
                 ]
                 console.print(json.dumps(data, indent=2, ensure_ascii=False))
             else:
-                table = Table(title=f"📰 {user} 的日报列表")
-                table.add_column("日期", style="cyan")
-                table.add_column("标题", style="green")
-                table.add_column("内容数", justify="right")
-                table.add_column("状态", style="yellow")
-                table.add_column("操作")
+                table = make_table(_REPORTS_LIST_COLUMNS, title=f"📰 {user} 的日报列表")
                 
                 for r in reports:
                     date_str = r.date.strftime("%Y-%m-%d") if r.date else "-"
@@ -1317,7 +859,7 @@ def reports_list(user: str, limit: int, format: str):
                 console.print(table)
                 console.print(f"\n[dim]使用 `python -m src.cli reports view <report_id>` 查看详情[/dim]")
     
-    asyncio.run(_list())
+    _run(_list())
 
 
 @reports.command("view")
@@ -1325,9 +867,10 @@ def reports_list(user: str, limit: int, format: str):
 @click.option("--format", "-f", type=click.Choice(["markdown", "json", "html"]), default="markdown", help="输出格式")
 def reports_view(report_id: str, format: str):
     """查看日报详情"""
+    console = get_console()
+    
     async def _view():
         from src.database import get_session, DailyReportRepository, ContentRepository
-        from src.output.formatter import MarkdownFormatter
         
         async with get_session() as session:
             repo = DailyReportRepository(session)
@@ -1372,20 +915,25 @@ def reports_view(report_id: str, format: str):
                 console.print(f"[yellow]HTML 格式暂不支持直接显示，请导出查看[/yellow]")
             
             else:  # markdown
-                console.print(f"\n[bold]{report.title}[/bold]\n")
-                console.print(f"日期: {report.date.strftime('%Y-%m-%d') if report.date else '-'}")
-                console.print(f"内容数: {report.total_items}")
-                console.print(f"推送状态: {'已推送' if report.is_sent else '未推送'}")
-                console.print("\n" + "━" * 50 + "\n")
+                lines = [
+                    f"\n[bold]{report.title}[/bold]\n",
+                    f"日期: {report.date.strftime('%Y-%m-%d') if report.date else '-'}",
+                    f"内容数: {report.total_items}",
+                    f"推送状态: {'已推送' if report.is_sent else '未推送'}",
+                    "\n" + "━" * 50 + "\n",
+                ]
                 
                 for i, item in enumerate(items[:20], 1):  # 最多显示20条
-                    console.print(f"{i}. [bold]{item.title}[/bold]")
-                    console.print(f"   [dim]{item.url}[/dim]")
+                    lines.append(f"{i}. [bold]{item.title}[/bold]")
+                    lines.append(f"   [dim]{item.url}[/dim]")
                     if item.summary:
-                        console.print(f"   {item.summary[:100]}...")
-                    console.print()
+                        lines.append(f"   {item.summary[:100]}...")
+                    lines.append("")
+                
+                # 全部内容拼接后一次输出
+                console.print("\n".join(lines))
     
-    asyncio.run(_view())
+    _run(_view())
 
 
 @reports.command("diff")
@@ -1393,6 +941,8 @@ def reports_view(report_id: str, format: str):
 @click.argument("report_id2")
 def reports_diff(report_id1: str, report_id2: str):
     """对比两份日报"""
+    console = get_console()
+    
     async def _diff():
         from src.database import get_session, DailyReportRepository, ContentRepository
         
@@ -1449,7 +999,7 @@ def reports_diff(report_id1: str, report_id2: str):
                 if len(only_in_2) > 5:
                     console.print(f"  ... 还有 {len(only_in_2) - 5} 条")
     
-    asyncio.run(_diff())
+    _run(_diff())
 
 
 @reports.command("stats")
@@ -1459,7 +1009,7 @@ def reports_stats():
         from src.metrics import print_performance_report
         await print_performance_report()
     
-    asyncio.run(_stats())
+    _run(_stats())
 
 
 @reports.command("export")
@@ -1468,7 +1018,16 @@ def reports_stats():
 @click.option("--format", "-f", type=click.Choice(["markdown", "html", "json"]), default="markdown", help="导出格式")
 def reports_export(report_id: str, output: str, format: str):
     """导出日报"""
+    from pathlib import Path
+    console = get_console()
+    
+    # 确定输出文件
+    if not output:
+        ext = {"markdown": ".md", "html": ".html"}.get(format, ".json")
+        output = f"report_{report_id}_{format}{ext}"
+    
     async def _export():
+        """查询日报并生成导出内容（文件写入放在事件循环之外）"""
         from src.database import get_session, DailyReportRepository, ContentRepository
         
         async with get_session() as session:
@@ -1478,19 +1037,9 @@ def reports_export(report_id: str, output: str, format: str):
             report = await repo.get_by_id(report_id)
             if not report:
                 console.print(f"[red]日报不存在: {report_id}[/red]")
-                return
+                return None
             
-            items = await content_repo.get_by_column(date=report.date)
-            
-            # 确定输出文件
-            if not output:
-                output = f"report_{report_id}_{format}"
-                if format == "markdown":
-                    output += ".md"
-                elif format == "html":
-                    output += ".html"
-                else:
-                    output += ".json"
+            items = await content_repo.get_by_column(column_id=None, date=report.date)
             
             # 生成内容
             if format == "markdown":
@@ -1539,13 +1088,15 @@ def reports_export(report_id: str, output: str, format: str):
                 }
                 content = json.dumps(data, indent=2, ensure_ascii=False)
             
-            # 写入文件
-            with open(output, "w", encoding="utf-8") as f:
-                f.write(content)
-            
-            console.print(f"[green]✅ 日报已导出到: {output}[/green]")
+            return content
     
-    asyncio.run(_export())
+    content = _run(_export())
+    if content is None:
+        return
+    
+    # 写入文件
+    Path(output).write_text(content, encoding="utf-8")
+    _say_ok(f"✅ 日报已导出到: {output}")
 
 
 # ============ 测试命令 ============
@@ -1560,9 +1111,11 @@ def test():
 @click.argument("source_name")
 def test_source(source_name: str):
     """测试单个数据源"""
+    console = get_console()
+    
     async def _test():
         from src.config import get_column_config
-        from src.collector import CollectorManager, RSSCollector, HackerNewsCollector, BilibiliCollector
+        from src.collector import RSSCollector, HackerNewsCollector, BilibiliCollector
         
         console.print(f"[bold]测试数据源: {source_name}[/bold]\n")
         
@@ -1632,13 +1185,15 @@ def test_source(source_name: str):
             if 'collector' in locals():
                 await collector.close()
     
-    asyncio.run(_test())
+    _run(_test())
 
 
 @test.command("channel")
 @click.argument("channel_name")
 def test_channel(channel_name: str):
     """测试推送渠道"""
+    console = get_console()
+    
     async def _test():
         from src.config import get_settings
         from src.output.publisher import Publisher
@@ -1710,12 +1265,14 @@ def test_channel(channel_name: str):
         except Exception as e:
             console.print(f"[red]✗ 测试出错: {e}[/red]")
     
-    asyncio.run(_test())
+    _run(_test())
 
 
 @test.command("llm")
 def test_llm():
     """测试 LLM 连接"""
+    console = get_console()
+    
     async def _test():
         from src.llm_config import get_llm_manager
         
@@ -1743,7 +1300,7 @@ def test_llm():
             console.print(f"[red]✗ 连接失败[/red]")
             console.print(f"  {message}")
     
-    asyncio.run(_test())
+    _run(_test())
 
 
 @test.command("rules")
@@ -1752,7 +1309,9 @@ def test_llm():
 def test_rules(column: str, source: str):
     """测试过滤规则效果"""
     from src.rule_tester import cli_test_rules
-    cli_test_rules(column_id=column, source_name=source)
+    
+    # 走共享的 _run（uvloop 事件循环）
+    cli_test_rules(column, source, run=_run)
 
 
 # ============ 快捷操作命令 ============
@@ -1767,24 +1326,28 @@ def disable():
 @click.argument("source_name")
 def disable_source(source_name: str):
     """临时禁用某个数据源"""
+    console = get_console()
+    
     async def _disable():
         console.print(f"[yellow]禁用数据源: {source_name}[/yellow]")
         console.print("\n[dim]提示: 此功能需要修改 config/columns.yaml[/dim]")
         console.print("请手动编辑配置文件，将对应源的 enabled 设为 false")
     
-    asyncio.run(_disable())
+    _run(_disable())
 
 
 @disable.command("column")
 @click.argument("column_id")
 def disable_column(column_id: str):
     """临时禁用某个分栏"""
+    console = get_console()
+    
     async def _disable():
         console.print(f"[yellow]禁用分栏: {column_id}[/yellow]")
         console.print("\n[dim]提示: 此功能需要修改 config/columns.yaml[/dim]")
         console.print("请手动编辑配置文件，将对应分栏的 enabled 设为 false")
     
-    asyncio.run(_disable())
+    _run(_disable())
 
 
 @cli.group()
@@ -1797,6 +1360,8 @@ def enable():
 @click.argument("source_name")
 def enable_source(source_name: str):
     """启用某个数据源"""
+    console = get_console()
+    
     console.print(f"[green]启用数据源: {source_name}[/green]")
     console.print("\n[dim]提示: 此功能需要修改 config/columns.yaml[/dim]")
 
@@ -1805,6 +1370,8 @@ def enable_source(source_name: str):
 @click.argument("column_id")
 def enable_column(column_id: str):
     """启用某个分栏"""
+    console = get_console()
+    
     console.print(f"[green]启用分栏: {column_id}[/green]")
     console.print("\n[dim]提示: 此功能需要修改 config/columns.yaml[/dim]")
 
@@ -1838,6 +1405,8 @@ def plugin_create(name: str, plugin_type: str):
 @click.argument("name")
 def plugin_load(name: str):
     """加载插件"""
+    console = get_console()
+    
     async def _load():
         from src.plugin_system import get_plugin_manager
         
@@ -1853,7 +1422,7 @@ def plugin_load(name: str):
         else:
             console.print(f"[red]✗ 插件 {name} 加载失败[/red]")
     
-    asyncio.run(_load())
+    _run(_load())
 
 
 # 简化命令别名
@@ -1861,26 +1430,20 @@ def plugin_load(name: str):
 @click.option("--user", "-u", default="default", help="用户 ID")
 def quickstart(user: str):
     """快速开始 - 运行完整设置向导"""
-    async def _quickstart():
-        from src.setup_wizard import SetupWizard
-        
-        wizard = SetupWizard(user_id=user)
-        await wizard.run_full_setup()
+    from src.setup_wizard import SetupWizard
     
-    asyncio.run(_quickstart())
+    _run(SetupWizard(user_id=user).run_full_setup())
 
 
 @cli.command()
 def preview():
     """预览今日日报（不保存）"""
+    console = get_console()
+    
     async def _preview():
-        from src.service import DailyAgentService
-        from src.output.formatter import MarkdownFormatter
-        
         console.print("[bold]生成日报预览...[/bold]\n")
         
-        service = DailyAgentService()
-        await service.initialize()
+        service = await _get_service()
         
         # 采集
         with console.status("[bold green]正在采集内容..."):
@@ -1890,20 +1453,16 @@ def preview():
         console.print(f"✓ 采集完成: {total} 条内容\n")
         
         # 显示采集结果
-        table = Table(title="采集结果")
-        table.add_column("来源", style="cyan")
-        table.add_column("状态", style="green")
-        table.add_column("数量", justify="right")
+        table = make_table(_COLLECT_COLUMNS[:3], title="采集结果")
         
         for name, result in results.items():
-            status = "✓" if result.success else "✗"
-            table.add_row(name, status, str(len(result.items)))
+            table.add_row(name, status_glyph(result.success), str(len(result.items)))
         
         console.print(table)
         console.print("\n[yellow]注意: 这只是预览，未生成正式日报[/yellow]")
         console.print("运行 [cyan]python -m src.cli generate[/cyan] 生成正式日报")
     
-    asyncio.run(_preview())
+    _run(_preview())
 
 
 # ============ 发送日报命令 ============
@@ -1919,12 +1478,12 @@ def send():
 @click.option("--preview", "-p", is_flag=True, help="预览模式（不实际发送）")
 def send_telegram(report_id: str, preview: bool):
     """发送日报到 Telegram"""
+    console = get_console()
+    
     async def _send():
         from datetime import datetime, timezone
-        from sqlalchemy.ext.asyncio import AsyncSession
         from src.database import get_session, DailyReportRepository
-        from src.models import DailyReport, ChannelType
-        from src.service import DailyAgentService
+        from src.models import ChannelType
         from src.config import get_settings
         
         settings = get_settings()
@@ -1942,8 +1501,7 @@ def send_telegram(report_id: str, preview: bool):
             return
         
         # 初始化服务
-        service = DailyAgentService()
-        await service.initialize()
+        service = await _get_service()
         
         # 获取日报
         if report_id:
@@ -1953,13 +1511,7 @@ def send_telegram(report_id: str, preview: bool):
                 if not db_report:
                     console.print(f"[red]✗ 日报不存在: {report_id}[/red]")
                     return
-                report = DailyReport(
-                    id=db_report.id,
-                    date=db_report.date,
-                    user_id=db_report.user_id,
-                    title=db_report.title,
-                    total_items=db_report.total_items
-                )
+                report = repo.to_model(db_report)
         else:
             # 获取最新日报
             async with get_session() as session:
@@ -1969,13 +1521,7 @@ def send_telegram(report_id: str, preview: bool):
                     console.print("[red]✗ 没有找到日报[/red]")
                     console.print("\n请先运行: [cyan]python -m src.cli generate[/cyan]")
                     return
-                report = DailyReport(
-                    id=db_report.id,
-                    date=db_report.date,
-                    user_id=db_report.user_id,
-                    title=db_report.title,
-                    total_items=db_report.total_items
-                )
+                report = repo.to_model(db_report)
         
         console.print(f"[bold]发送日报到 Telegram[/bold]\n")
         console.print(f"日报: {report.title}")
@@ -1999,22 +1545,22 @@ def send_telegram(report_id: str, preview: bool):
             if result:
                 console.print(f"  错误: {result.message}")
     
-    asyncio.run(_send())
+    _run(_send())
 
 
 @send.command("latest")
 @click.option("--channel", "-c", default="telegram", type=click.Choice(["telegram", "slack", "discord", "email"]), help="目标渠道")
 def send_latest(channel: str):
     """发送最新日报到指定渠道"""
+    console = get_console()
+    
     async def _send():
         from datetime import datetime, timezone
         from src.database import get_session, DailyReportRepository
-        from src.models import DailyReport, ChannelType
-        from src.service import DailyAgentService
+        from src.models import ChannelType
         
         # 初始化服务
-        service = DailyAgentService()
-        await service.initialize()
+        service = await _get_service()
         
         # 获取最新日报
         async with get_session() as session:
@@ -2024,13 +1570,7 @@ def send_latest(channel: str):
                 console.print("[red]✗ 没有找到日报[/red]")
                 console.print("\n请先运行: [cyan]python -m src.cli generate[/cyan]")
                 return
-            report = DailyReport(
-                id=db_report.id,
-                date=db_report.date,
-                user_id=db_report.user_id,
-                title=db_report.title,
-                total_items=db_report.total_items
-            )
+            report = repo.to_model(db_report)
         
         # 映射渠道
         channel_map = {
@@ -2058,18 +1598,12 @@ def send_latest(channel: str):
             if result:
                 console.print(f"  错误: {result.message}")
     
-    asyncio.run(_send())
+    _run(_send())
 
 
 @cli.command(name="expert")
 def expert_setup():
     """专家模式 - LLM 辅助配置（推荐）"""
-    async def _expert():
-        from src.expert_setup import run_expert_setup
-        await run_expert_setup()
-
-    asyncio.run(_expert())
-
-
-if __name__ == "__main__":
-    cli()
+    from src.expert_setup import run_expert_setup
+    
+    _run(run_expert_setup())
@@ -0,0 +1,63 @@
+"""
+python -m src.cli 入口
+
+--help / --version / 无参数时直接输出静态文本，不导入 click、rich 等模块
+"""
+import sys
+
+from src import __version__
+
+# 与 `cli --help` 输出保持一致（新增顶层命令时同步更新）
+_HELP = """\
+Usage: python -m src.cli [OPTIONS] COMMAND [ARGS]...
+
+  Daily Agent CLI
+
+Options:
+  -v, --version  Show the version and exit.
+  --help         Show this message and exit.
+
+Commands:
+  auth            认证管理 - 管理需要登录的信息渠道
+  collect         手动触发采集
+  config          配置管理 - 查看、导出、导入配置
+  disable         禁用数据源或分栏
+  doctor          运行系统诊断 - 检查环境、配置、依赖等
+  enable          启用数据源或分栏
+  expert          专家模式 - LLM 辅助配置（推荐）
+  fix             自动修复系统问题
+  generate        生成日报
+  init            初始化数据库
+  llm             LLM 配置管理 - 配置大语言模型
+  plugin          插件管理 - 管理自定义采集器、处理器、推送渠道
+  preview         预览今日日报（不保存）
+  push            推送日报
+  quickstart      快速开始 - 运行完整设置向导
+  reports         日报管理 - 查看、对比历史日报
+  send            发送日报到指定渠道
+  setup           启动设置向导 - 配置用户画像、兴趣和日报
+  setup-telegram  配置 Telegram Bot
+  start           启动 Daily Agent 服务
+  status          查看系统状态
+  test            测试工具 - 测试采集器、推送渠道等
+  verify          验证配置
+"""
+
+
+def _fast_path(argv) -> bool:
+    """处理无需解析命令的参数，返回是否已处理"""
+    if not argv or argv[0] in ("-h", "--help"):
+        sys.stdout.write(_HELP)
+        return True
+    if argv[0] in ("-v", "--version"):
+        sys.stdout.write(f"Daily Agent CLI {__version__}\n")
+        return True
+    return False
+
+
+if __name__ == "__main__":
+    if _fast_path(sys.argv[1:2]):
+        raise SystemExit(0)
+    
+    from src.cli import cli
+    cli()
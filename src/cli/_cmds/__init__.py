@@ -0,0 +1,3 @@
+"""
+按需加载的 CLI 子命令组（由 src.cli.LazyGroup 在调用时导入）
+"""
@@ -0,0 +1,314 @@
+"""
+认证管理命令
+"""
+from functools import lru_cache
+
+import click
+
+from src.cli._util import _run, _say, _say_err, _say_ok, auth_manager, get_console, make_table
+
+
+@click.group()
+def auth():
+    """认证管理 - 管理需要登录的信息渠道"""
+    pass
+
+
+# 认证列表表格列定义（内容长度固定的列指定宽度，渲染时无需逐行测量）
+_AUTH_LIST_COLUMNS = (
+    ("渠道", {"style": "cyan"}),
+    ("认证方式", {"style": "blue", "width": 8}),
+    ("用户信息", {"style": "green"}),
+    ("过期时间", {"style": "yellow", "width": 16}),
+    ("状态", {"style": "bold", "width": 10}),
+)
+
+
+@auth.command("list")
+def auth_list():
+    """列出所有已配置的认证"""
+    console = get_console()
+    
+    async def _list():
+        from datetime import datetime, timedelta, timezone
+        
+        manager = auth_manager()
+        credentials = await manager.list_auth()
+        
+        if not credentials:
+            console.print(_empty_list_hint())
+            return
+        
+        table = make_table(_AUTH_LIST_COLUMNS, title="已配置的认证")
+        
+        # 当前时间只取一次；剩余不足 4 天（即剩余天数 <= 3）视为即将过期
+        now = datetime.now(timezone.utc)
+        soon = now + timedelta(days=4)
+        
+        for cred in credentials:
+            expires_at = cred["expires_at"]
+            if expires_at and expires_at.tzinfo is None:
+                # SQLite 读出的时间不带时区
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            expires = expires_at.strftime("%Y-%m-%d %H:%M") if expires_at else "未知"
+            status = _status_text(_credential_status(cred["is_valid"], expires_at, now, soon))
+            
+            user_info = cred["username"] or "-"
+            
+            table.add_row(
+                f"{cred['display_name']}\n[cyan]({cred['source_name']})[/cyan]",
+                cred["auth_type"],
+                user_info,
+                expires,
+                status
+            )
+        
+        console.print(table)
+    
+    _run(_list())
+
+
+def _credential_status(is_valid: bool, expires_at, now, soon) -> str:
+    """计算认证状态（返回带样式的文本）"""
+    if not is_valid:
+        return "[red]✗ 失效[/red]"
+    if expires_at and expires_at < now:
+        return "[red]✗ 已过期[/red]"
+    if expires_at and expires_at < soon:
+        return "[yellow]⚠ 即将过期[/yellow]"
+    return "[green]✓ 有效[/green]"
+
+
+@lru_cache(maxsize=None)
+def _status_text(markup: str):
+    """状态只有几种取值，解析后的 Text 在各行间复用，避免逐行解析标记"""
+    from rich.text import Text
+    return Text.from_markup(markup)
+
+
+@lru_cache(maxsize=1)
+def _empty_list_hint() -> str:
+    """无认证配置时的提示（含支持的渠道列表，只拼接一次）"""
+    lines = [
+        "[yellow]暂无认证配置[/yellow]",
+        "\n使用 [cyan]python -m src.cli auth add <渠道名>[/cyan] 添加认证",
+        "\n支持的渠道:",
+    ]
+    lines.extend(
+        f"  • [green]{key}[/green] - {config.display_name}"
+        for key, config in auth_manager().get_supported_sources().items()
+    )
+    return "\n".join(lines)
+
+
+@auth.command("add")
+@click.argument("source_name")
+@click.option("--username", "-u", help="用户名（可选）")
+@click.option("--browser", "-b", is_flag=True, help="使用浏览器自动获取（推荐）")
+@click.option("--manual", "-m", is_flag=True, help="手动粘贴 cURL")
+def auth_add(source_name: str, username: str = None, browser: bool = False, manual: bool = False):
+    """添加认证配置"""
+    manager = auth_manager()
+    config = manager.get_config(source_name)
+    
+    if not config:
+        click.echo(f"不支持的渠道: {source_name}")
+        click.echo("\n支持的渠道:")
+        for key, cfg in manager.get_supported_sources().items():
+            click.echo(f"  • {key} - {cfg.display_name}")
+        return
+    
+    _interactive_add(manager, config, source_name, username, browser, manual)
+
+
+def _interactive_add(manager, config, source_name: str, username: str = None,
+                     browser: bool = False, manual: bool = False):
+    """交互式添加认证（add 与 update 共用，复用调用方已获取的 manager 和 config）"""
+    # 选择方式
+    if not browser and not manual:
+        click.echo(f"\n{'='*60}")
+        click.echo(f"正在为 [{config.display_name}] 配置认证信息")
+        click.echo(f"{'='*60}\n")
+        click.echo("请选择获取方式:")
+        click.echo("  [1] 🌐 浏览器自动获取（推荐）- 自动登录并提取 Cookie")
+        click.echo("  [2] 📋 手动粘贴 cURL - 从浏览器开发者工具复制")
+        choice = click.prompt("请选择", type=str, default="1")
+        browser = choice == "1"
+        manual = choice == "2"
+    
+    if browser:
+        # 浏览器自动获取
+        _auth_add_browser(source_name, username)
+    else:
+        # 手动粘贴
+        _auth_add_manual(manager, config, source_name, username)
+
+
+def _auth_add_browser(source_name: str, username: str = None):
+    """使用浏览器自动获取 Cookie"""
+    async def _browser_auth():
+        from src.browser_auth import interactive_auth, close_browser
+        try:
+            success, message = await interactive_auth(source_name, username)
+        finally:
+            await close_browser()
+        if success:
+            click.echo(f"\n✓ {message}")
+        else:
+            click.echo(f"\n✗ {message}")
+    
+    _run(_browser_auth())
+
+
+def _auth_add_manual(manager, config, source_name: str, username: str = None):
+    """手动粘贴 cURL"""
+    import sys
+    
+    click.echo("\n" + "-"*40)
+    click.echo(config.help_text)
+    click.echo("-"*40)
+    click.echo("\n请粘贴 cURL 命令或 Cookie 字符串:")
+    
+    try:
+        if sys.stdin.isatty():
+            curl_command = input("> ").strip()
+        else:
+            # 管道输入（如 cat curl.txt | ...）一次读完，支持多行 cURL
+            curl_command = sys.stdin.read().strip()
+    except (EOFError, KeyboardInterrupt):
+        click.echo("\n已取消")
+        return
+    
+    curl_command = curl_command.replace("\\", "")
+    
+    if not curl_command:
+        click.echo("输入为空，取消配置")
+        return
+    
+    async def _save_and_test():
+        click.echo("正在保存...")
+        success, message = await manager.add_auth(source_name, curl_command, username)
+        
+        if success:
+            click.echo(f"✓ {message}")
+            
+            # 对严格反爬平台，跳过 HTTP 测试（避免 406）
+            if source_name in ['douyin']:
+                click.echo("✓ Cookie 已保存（适合配合浏览器采集器使用）")
+            else:
+                click.echo("正在测试...")
+                is_valid, test_msg, _ = await manager.test_auth(source_name)
+                if is_valid:
+                    click.echo(f"✓ 测试通过")
+                else:
+                    click.echo(f"⚠ 测试未通过: {test_msg}")
+        else:
+            click.echo(f"✗ {message}")
+    
+    _run(_save_and_test())
+
+
+@auth.command("update")
+@click.argument("source_name")
+@click.option("--username", "-u", help="用户名（可选）")
+def auth_update(source_name: str, username: str = None):
+    """更新认证配置"""
+    manager = auth_manager()
+    config = manager.get_config(source_name)
+    
+    if not config:
+        _say_err(f"不支持的渠道: {source_name}")
+        return
+    
+    # 检查现有配置
+    async def _get_existing():
+        from src.database import get_session, AuthCredentialRepository
+        async with get_session() as session:
+            repo = AuthCredentialRepository(session)
+            return await repo.get_by_source(source_name)
+    
+    existing = _run(_get_existing())
+    if existing:
+        _say(f"当前配置将于 {existing.expires_at.strftime('%Y-%m-%d %H:%M')} 过期\n", fg="blue")
+    
+    # 复用 add 逻辑
+    _interactive_add(manager, config, source_name, username)
+
+
+@auth.command("remove")
+@click.argument("source_name")
+@click.confirmation_option(prompt="确定要删除此认证配置吗?")
+def auth_remove(source_name: str):
+    """删除认证配置"""
+    success, message = _run(auth_manager().remove_auth(source_name))
+    
+    if success:
+        _say_ok(message)
+    else:
+        _say_err(message)
+
+
+@auth.command("test")
+@click.argument("source_name")
+def auth_test(source_name: str):
+    """测试认证是否有效"""
+    console = get_console()
+    
+    async def _test():
+        manager = auth_manager()
+        config = manager.get_config(source_name)
+        
+        if not config:
+            _say_err(f"不支持的渠道: {source_name}")
+            return
+        
+        _say(f"测试 [{config.display_name}] 认证状态...\n", bold=True)
+        
+        with console.status("[bold green]正在测试认证..."):
+            is_valid, message, user_info = await manager.test_auth(source_name)
+        
+        if is_valid:
+            _say_ok("✓ 认证有效")
+            if user_info:
+                if user_info.get("username"):
+                    click.echo(f"  用户名: {click.style(user_info['username'], fg='cyan')}")
+                if user_info.get("user_id"):
+                    click.echo(f"  用户ID: {click.style(user_info['user_id'], dim=True)}")
+        else:
+            _say_err(f"✗ {message}")
+    
+    _run(_test())
+
+
+@auth.command("guide")
+def auth_guide():
+    """显示认证配置指南"""
+    from rich.console import Group
+    
+    # 标题、各渠道面板和命令提示组合为一个渲染对象，一次输出
+    get_console().print(Group(*_guide_parts()))
+
+
+@lru_cache(maxsize=1)
+def _guide_parts():
+    """认证指南的渲染对象（渠道配置是静态的，面板只构建一次）"""
+    from rich.panel import Panel
+    
+    parts = ["[bold blue]认证配置指南[/bold blue]\n", "以下渠道需要登录认证才能采集个性化内容:\n"]
+    
+    for key, config in auth_manager().get_supported_sources().items():
+        parts.append(Panel(
+            f"[bold]{config.display_name}[/bold] ([cyan]{key}[/cyan])\n"
+            f"[dim]认证方式:[/dim] {config.auth_type}\n"
+            f"[dim]默认有效期:[/dim] {config.expires_days} 天\n\n"
+            f"{config.help_text}",
+            border_style="green"
+        ))
+    
+    parts += [
+        "\n[bold]常用命令:[/bold]",
+        "  [cyan]python -m src.cli auth list[/cyan]     - 查看已配置的认证",
+        "  [cyan]python -m src.cli auth add jike[/cyan] - 添加即刻认证",
+        "  [cyan]python -m src.cli auth test jike[/cyan] - 测试即刻认证",
+    ]
+    return tuple(parts)
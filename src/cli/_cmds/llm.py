@@ -0,0 +1,73 @@
+"""
+LLM 配置命令
+"""
+import click
+
+from src.cli._util import _run, _say, _say_err, _say_ok, _say_warn, get_console
+
+
+@click.group()
+def llm():
+    """LLM 配置管理 - 配置大语言模型"""
+    pass
+
+
+@llm.command("setup")
+def llm_setup():
+    """启动 LLM 配置向导"""
+    from src.llm_config import LLMSetupWizard
+    
+    _run(LLMSetupWizard().run_setup())
+
+
+@llm.command("status")
+def llm_status():
+    """查看 LLM 配置状态"""
+    from src.llm_config import LLMSetupWizard
+    
+    _run(LLMSetupWizard().print_status())
+
+
+@llm.command("test")
+def llm_test():
+    """测试 LLM 连接"""
+    console = get_console()
+    
+    async def _test():
+        from src.llm_config import get_llm_manager
+        
+        manager = get_llm_manager()
+        config = manager.get_current_config()
+        
+        if not config.is_configured():
+            _say_warn("⚠️ 尚未配置 LLM，请先运行: python -m src.cli llm setup")
+            return
+        
+        _say("🧪 正在测试 LLM 连接...\n", bold=True)
+        
+        with console.status("[bold green]测试中..."):
+            success, message = await manager.test_connection()
+        
+        if success:
+            _say_ok(f"✅ {message}")
+        else:
+            _say_err(f"✗ {message}")
+    
+    _run(_test())
+
+
+@llm.command("switch")
+def llm_switch():
+    """切换 LLM 模型"""
+    from src.llm_config import LLMSetupWizard
+    
+    _run(LLMSetupWizard().switch_model())
+
+
+@llm.command("models")
+def llm_models():
+    """查看支持的模型列表"""
+    from src.llm_config import LLMSetupWizard
+    
+    wizard = LLMSetupWizard()
+    wizard.print_models()
@@ -0,0 +1,155 @@
+"""
+启动设置向导命令
+"""
+import click
+
+from src.cli._util import _run, _say_err, _say_ok, _say_warn, get_console, make_table
+
+
+@click.group(invoke_without_command=True)
+@click.option("--all", "all_modules", is_flag=True, help="完整重新配置所有模块")
+@click.option("--module", "module_name", type=click.Choice(["profile", "interests", "daily", "llm", "channels"]), help="仅配置特定模块")
+@click.option("--mode", type=click.Choice(["fast", "configure"]), help="启动模式")
+@click.option("--template", help="使用预设模板")
+@click.pass_context
+def setup(ctx, all_modules: bool, module_name: str, mode: str, template: str):
+    """启动设置向导 - 配置用户画像、兴趣和日报"""
+    console = get_console()
+    
+    if ctx.invoked_subcommand is not None:
+        return
+    
+    async def _setup():
+        # 如果指定了模式，执行对应的启动流程
+        if mode == "fast":
+            console.print("⚡ Fast 模式启动...")
+            if template:
+                from src.setup_wizard import apply_template
+                if await apply_template(template):
+                    console.print(f"✓ 应用模板: {template}")
+                else:
+                    console.print(f"[yellow]⚠ 未知模板: {template}[/yellow]")
+            console.print("✅ Fast 模式配置完成！")
+            return
+        
+        elif mode == "configure" or all_modules or module_name:
+            from src.setup_wizard import SetupWizard
+            wizard = SetupWizard()
+            
+            if all_modules:
+                await wizard.run_full_setup()
+            elif module_name:
+                # 仅配置特定模块
+                if module_name == "profile":
+                    wizard.profile_config = await wizard._setup_profile()
+                    await wizard._save_config()
+                elif module_name == "interests":
+                    wizard.interest_config = await wizard._setup_interests()
+                    await wizard._save_config()
+                elif module_name == "daily":
+                    wizard.daily_config = await wizard._setup_daily_report()
+                    await wizard._save_daily_config()
+                elif module_name == "llm":
+                    await wizard._setup_llm()
+                console.print(f"✅ {module_name} 模块配置完成！")
+            else:
+                await wizard.run_full_setup()
+            return
+        
+        # 默认运行完整向导
+        from src.setup_wizard import SetupWizard
+        wizard = SetupWizard()
+        await wizard.run_full_setup()
+    
+    _run(_setup())
+
+
+@setup.command("wizard")
+@click.option("--user", "-u", default="default", help="用户 ID")
+def setup_wizard(user: str):
+    """运行完整设置向导"""
+    from src.setup_wizard import SetupWizard
+    
+    _run(SetupWizard(user_id=user).run_full_setup())
+
+
+@setup.command("export")
+@click.option("--user", "-u", default="default", help="用户 ID")
+@click.option("--format", "-f", type=click.Choice(["yaml", "json"]), default="yaml", help="导出格式")
+@click.option("--output", "-o", help="输出文件路径")
+def setup_export(user: str, format: str, output: str):
+    """导出用户配置"""
+    
+    async def _export():
+        from src.setup_wizard import export_config
+        
+        try:
+            filepath = await export_config(user_id=user, format=format, output=output)
+            _say_ok(f"✅ 配置已导出到: {filepath}")
+        except ValueError as e:
+            _say_err(f"✗ {e}")
+    
+    _run(_export())
+
+
+@setup.command("import")
+@click.argument("filepath")
+@click.option("--user", "-u", default="default", help="用户 ID")
+@click.option("--force", "-f", is_flag=True, help="强制覆盖现有配置")
+def setup_import(filepath: str, user: str, force: bool):
+    """导入用户配置"""
+    
+    async def _import():
+        from src.setup_wizard import import_config
+        
+        try:
+            success = await import_config(filepath, user_id=user, overwrite=force)
+            if success:
+                _say_ok("✅ 配置导入成功")
+            else:
+                _say_warn("⚠️ 用户已有配置，使用 --force 覆盖")
+        except Exception as e:
+            _say_err(f"✗ 导入失败: {e}")
+    
+    _run(_import())
+
+
+# 模板表格列定义
+_TEMPLATE_COLUMNS = (
+    ("模板ID", {"style": "cyan"}),
+    ("名称", {"style": "green"}),
+    ("描述", {}),
+    ("阅读时间", {}),
+)
+
+
+@setup.command("templates")
+def setup_templates():
+    """查看可用配置模板"""
+    from src.setup_wizard import PROFILE_TEMPLATES
+    console = get_console()
+    
+    console.print("[bold blue]可用配置模板[/bold blue]\n")
+    
+    table = make_table(_TEMPLATE_COLUMNS)
+    
+    for key, template in PROFILE_TEMPLATES.items():
+        table.add_row(
+            key,
+            template.name,
+            template.description,
+            f"{template.daily_time_minutes} 分钟"
+        )
+    
+    console.print(table)
+    
+    console.print("\n[bold]使用模板快速设置：[/bold]")
+    console.print("  [cyan]python -m src.cli setup wizard[/cyan]  - 启动向导并选择模板")
+
+
+@setup.command("expert")
+def setup_expert():
+    """专家模式 - LLM 辅助配置（推荐深度定制用户）"""
+    from src.expert_setup import run_expert_setup
+    
+    _run(run_expert_setup())
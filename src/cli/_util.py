@@ -0,0 +1,111 @@
+"""
+CLI 共享工具
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_console():
+    """获取共享的 Rich Console（首次使用时才导入 rich）"""
+    from rich.console import Console
+    return Console()
+
+
+@lru_cache(maxsize=None)
+def status_glyph(ok: bool):
+    """带样式的 ✓ / ✗ 符号（Text 只创建一次，各行复用，无需逐行解析标记）"""
+    from rich.text import Text
+    return Text("✓", style="green") if ok else Text("✗", style="red")
+
+
+def _say(message, **style):
+    """输出单行状态信息（click.style 直接包裹 ANSI，无需经过 Rich 渲染）"""
+    import click
+    click.echo(click.style(message, **style) if style else message)
+
+
+def _say_ok(message):
+    _say(message, fg="green")
+
+
+def _say_warn(message):
+    _say(message, fg="yellow")
+
+
+def _say_err(message):
+    _say(message, fg="red")
+
+
+def auth_manager():
+    """获取认证管理器单例（auth_manager 依赖较重，首次使用时才导入）"""
+    from src.auth_manager import get_auth_manager
+    return get_auth_manager()
+
+
+def make_table(columns, title=None):
+    """按列定义 ((列名, add_column 参数), ...) 创建 Rich 表格"""
+    from rich.table import Table
+    table = Table(title=title)
+    for name, kwargs in columns:
+        table.add_column(name, **kwargs)
+    return table
+
+
+# 进程内共享的事件循环运行器及服务实例（同一进程多次运行协程时复用）
+_runner = None
+_service = None
+_service_lock = None
+
+
+def _run(coro):
+    """在进程共享的事件循环中运行协程（按需导入 asyncio，命令注册阶段无需加载）"""
+    global _runner
+    if _runner is None:
+        import asyncio
+        import atexit
+        _runner = asyncio.Runner(loop_factory=_loop_factory())
+        atexit.register(_close_runner)
+    return _runner.run(coro)
+
+
+def _loop_factory():
+    """优先使用 uvloop（随 uvicorn[standard] 安装）；设置 DAILY_NO_UVLOOP=1 可退回默认事件循环便于调试"""
+    import os
+    if os.environ.get("DAILY_NO_UVLOOP"):
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def _close_runner():
+    """进程退出时关闭共享连接和事件循环"""
+    global _runner, _service
+    import sys
+    runner, _runner = _runner, None
+    _service = None
+    if runner is None:
+        return
+    try:
+        if "src.auth_manager" in sys.modules:
+            from src.auth_manager import close_http_client
+            runner.run(close_http_client())
+    finally:
+        runner.close()
+
+
+async def _get_service():
+    """获取已初始化的 DailyAgentService（进程内只创建一次）"""
+    global _service, _service_lock
+    import asyncio
+    if _service_lock is None:
+        _service_lock = asyncio.Lock()
+    async with _service_lock:
+        if _service is None:
+            from src.service import DailyAgentService
+            service = DailyAgentService()
+            await service.initialize()
+            _service = service
+    return _service
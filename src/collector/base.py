@@ -6,7 +6,7 @@ import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
@@ -203,27 +203,47 @@ class CollectorManager:
         Returns:
             Dict[str, CollectorResult]: 采集结果字典
         """
-        max_concurrent = max_concurrent or settings.max_concurrent_collectors
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def collect_with_limit(collector: BaseCollector) -> tuple:
-            async with semaphore:
-                try:
-                    result = await collector.collect()
-                    return collector.name, result
-                except Exception as e:
-                    return collector.name, CollectorResult(
-                        success=False,
-                        message=str(e)
-                    )
-                finally:
-                    await collector.close()
-        
-        tasks = [collect_with_limit(c) for c in self.collectors]
+        semaphore = asyncio.Semaphore(max_concurrent or settings.max_concurrent_collectors)
+        tasks = [self._collect_with_limit(c, semaphore) for c in self.collectors]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         return {name: result for name, result in results if not isinstance(result, Exception)}
     
+    async def iter_collect(self, max_concurrent: int = None) -> AsyncIterator[Tuple[str, CollectorResult]]:
+        """
+        执行所有采集器，按完成先后逐个产出结果
+        
+        Args:
+            max_concurrent: 最大并发数
+            
+        Yields:
+            (采集器名称, 采集结果)
+        """
+        semaphore = asyncio.Semaphore(max_concurrent or settings.max_concurrent_collectors)
+        tasks = [asyncio.ensure_future(self._collect_with_limit(c, semaphore)) for c in self.collectors]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 调用方提前退出时取消尚未完成的采集
+            for task in tasks:
+                task.cancel()
+    
+    @staticmethod
+    async def _collect_with_limit(collector: BaseCollector, semaphore: asyncio.Semaphore) -> tuple:
+        """在并发限制下执行单个采集器（异常转为失败结果）"""
+        async with semaphore:
+            try:
+                result = await collector.collect()
+                return collector.name, result
+            except Exception as e:
+                return collector.name, CollectorResult(
+                    success=False,
+                    message=str(e)
+                )
+            finally:
+                await collector.close()
+    
     def get_collector(self, name: str) -> Optional[BaseCollector]:
         """获取指定采集器"""
         for c in self.collectors:
@@ -366,7 +366,7 @@ class TonghuashunCollector(BaseCollector):
         if time_elem:
             time_str = time_elem.get_text(strip=True)
             try:
-                publish_time = datetime.strptime(time_str, "%Y-%m-%d %H:%M")
+                publish_time = datetime.fromisoformat(time_str)
             except:
                 pass
         
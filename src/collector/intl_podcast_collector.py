@@ -209,7 +209,7 @@ class SpotifyPodcastCollector(BaseCollector):
         release_date = episode.get("release_date")
         if release_date:
             try:
-                publish_time = datetime.strptime(release_date, "%Y-%m-%d")
+                publish_time = datetime.fromisoformat(release_date)
             except:
                 pass
         
@@ -393,7 +393,7 @@ class XimalayaCollector(BaseCollector):
         publish_time = None
         if track.get("createDateFormat"):
             try:
-                publish_time = datetime.strptime(track["createDateFormat"], "%Y-%m-%d %H:%M:%S")
+                publish_time = datetime.fromisoformat(track["createDateFormat"])
             except:
                 pass
         
@@ -16,6 +16,18 @@ PROJECT_ROOT = Path(__file__).parent.parent.absolute()
 DATA_DIR = PROJECT_ROOT / "data"
 CONFIG_DIR = PROJECT_ROOT / "config"
 
+# YAML 读写使用 safe 版本（只输出/接受标准类型），优先使用 libyaml 的 C 实现，未编译 libyaml 时退回纯 Python 版本
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 推送渠道: (配置项, 显示名称)
+PUSH_CHANNELS = (
+    ("telegram_bot_token", "Telegram"),
+    ("slack_bot_token", "Slack"),
+    ("discord_bot_token", "Discord"),
+    ("smtp_host", "Email"),
+)
+
 
 class Settings(BaseSettings):
     """应用配置类"""
@@ -62,6 +74,8 @@ class Settings(BaseSettings):
     llm_timeout: float = Field(default=30.0, description="LLM 请求超时（秒）")
     llm_cache_size: int = Field(default=1000, description="LLM 结果缓存大小")
     llm_batch_mode: bool = Field(default=True, description="启用批量 LLM 模式（一次处理多条）")
+    llm_rpm_limit: int = Field(default=500, description="LLM 每分钟请求数上限（0 表示不限制）")
+    llm_tpm_limit: int = Field(default=0, description="LLM 每分钟 token 数上限（0 表示不限制）")
     
     # ===== 采集配置 =====
     max_concurrent_collectors: int = Field(default=5, description="最大并发采集数")
@@ -103,6 +117,10 @@ class Settings(BaseSettings):
         if v.lower() not in allowed:
             raise ValueError(f"log_level 必须是以下之一: {allowed}")
         return v.lower()
+    
+    def configured_channels(self) -> List[str]:
+        """返回已配置的推送渠道名称"""
+        return [name for attr, name in PUSH_CHANNELS if getattr(self, attr)]
 
 
 @lru_cache()
@@ -117,15 +135,19 @@ class ColumnConfig:
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or (CONFIG_DIR / "columns.yaml")
         self._config: Optional[dict] = None
+        self._mtime: Optional[int] = None
     
     def load(self) -> dict:
-        """加载分栏配置"""
-        if self._config is None:
-            if not self.config_path.exists():
-                raise FileNotFoundError(f"配置文件不存在: {self.config_path}")
-            
+        """加载分栏配置（按文件修改时间缓存，文件变更后自动重新解析）"""
+        try:
+            mtime = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"配置文件不存在: {self.config_path}") from None
+        
+        if self._config is None or mtime != self._mtime:
             with open(self.config_path, "r", encoding="utf-8") as f:
-                self._config = yaml.safe_load(f)
+                self._config = yaml.load(f, Loader=YamlLoader)
+            self._mtime = mtime
         
         return self._config
     
@@ -165,6 +187,10 @@ class ColumnConfig:
         return config.get("quality_filter", {})
 
 
+# 读取分栏配置可能出现的异常：文件缺失、内容为空或结构不符、YAML 格式错误
+COLUMN_CONFIG_ERRORS = (OSError, AttributeError, TypeError, yaml.YAMLError)
+
+
 @lru_cache()
 def get_column_config() -> ColumnConfig:
     """获取分栏配置单例"""
@@ -3,12 +3,14 @@
 使用 SQLAlchemy 2.0 语法
 """
 import json
+import zlib
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import AsyncGenerator, List, Optional
 
 from sqlalchemy import (
     JSON, DateTime, Float, ForeignKey, Integer, String, Text, 
-    create_engine, select, delete, func, text
+    create_engine, event, select, delete, func, text
 )
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -219,18 +221,63 @@ def init_engine():
                 "check_same_thread": False,
             }
         )
+        if url.startswith("sqlite"):
+            event.listen(_engine.sync_engine, "connect", _set_sqlite_pragma)
     return _engine
 
 
-async def init_db():
-    """初始化数据库表"""
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    """每个新连接都设置的 PRAGMA（synchronous 只对当前连接生效）"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+@lru_cache(maxsize=1)
+def _schema_fingerprint() -> int:
+    """表结构指纹：全部建表及建索引语句的 CRC32（取正数，作为 SQLite user_version 存储）"""
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.schema import CreateIndex, CreateTable
+    
+    dialect = sqlite.dialect()
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        ddl.extend(
+            str(CreateIndex(index).compile(dialect=dialect))
+            for index in sorted(table.indexes, key=lambda ix: ix.name)
+        )
+    return zlib.crc32("".join(ddl).encode()) & 0x7FFFFFFF or 1
+
+
+def _create_schema(sync_conn):
+    """建表，并为已存在的表补建新增的索引（create_all 只为新建的表建索引）"""
+    Base.metadata.create_all(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+async def init_db(force: bool = False):
+    """
+    初始化数据库表
+    
+    表结构指纹记录在 SQLite 的 user_version 中，结构未变化时只需一次查询即可跳过建表；
+    force=True 时总是执行建表（用于修复缺失的表）
+    """
     engine = init_engine()
+    is_sqlite = "sqlite" in str(engine.url)
     async with engine.begin() as conn:
-        # 启用 WAL 模式，减少数据库锁定问题
-        if "sqlite" in str(engine.url):
+        if is_sqlite:
+            if not force:
+                version = (await conn.execute(text("PRAGMA user_version"))).scalar()
+                if version == _schema_fingerprint():
+                    return
+            # 启用 WAL 模式（持久保存在数据库文件中），减少数据库锁定问题
             await conn.execute(text("PRAGMA journal_mode=WAL"))
-            await conn.execute(text("PRAGMA synchronous=NORMAL"))
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_schema)
+        if is_sqlite:
+            await conn.execute(text(f"PRAGMA user_version = {_schema_fingerprint()}"))
 
 
 from contextlib import asynccontextmanager
@@ -325,6 +372,15 @@ class ContentRepository:
         )
         return result.scalar()
     
+    async def count_by_date(self, date: datetime) -> int:
+        """统计指定日期采集的内容数量"""
+        start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        end = start + timedelta(days=1)
+        result = await self.session.execute(
+            select(func.count()).where(ContentItemDB.fetch_time >= start, ContentItemDB.fetch_time < end)
+        )
+        return result.scalar()
+    
     async def get_by_status(
         self, 
         status: str,
@@ -345,6 +401,16 @@ class ContentRepository:
         return result.scalars().all()
 
 
+# 推送时构建 DailyReport 模型所需的日报字段
+_REPORT_MODEL_COLUMNS = (
+    DailyReportDB.id,
+    DailyReportDB.date,
+    DailyReportDB.user_id,
+    DailyReportDB.title,
+    DailyReportDB.total_items,
+)
+
+
 class DailyReportRepository:
     """日报仓库"""
     
@@ -358,11 +424,28 @@ class DailyReportRepository:
         return report
     
     async def get_by_id(self, report_id: str) -> Optional[DailyReportDB]:
-        """根据ID获取日报"""
+        """根据ID获取日报（按主键查找，命中会话标识映射时不再查询）"""
+        return await self.session.get(DailyReportDB, report_id)
+    
+    async def get_model_by_id(self, report_id: str):
+        """根据ID获取推送所需的日报模型（只查询所需字段，不加载 ORM 实例）"""
         result = await self.session.execute(
-            select(DailyReportDB).where(DailyReportDB.id == report_id)
+            select(*_REPORT_MODEL_COLUMNS).where(DailyReportDB.id == report_id)
+        )
+        row = result.first()
+        return self.to_model(row) if row else None
+    
+    @staticmethod
+    def to_model(report):
+        """日报记录（ORM 实例或查询行）转换为 DailyReport 模型（字段直接来自数据库，跳过校验）"""
+        from src.models import DailyReport
+        return DailyReport.model_construct(
+            id=report.id,
+            date=report.date,
+            user_id=report.user_id,
+            title=report.title,
+            total_items=report.total_items
         )
-        return result.scalar_one_or_none()
     
     async def get_by_date(
         self, 
@@ -455,6 +538,21 @@ class AuthCredentialRepository:
         )
         return result.scalars().all()
     
+    async def get_all_summaries(self) -> list:
+        """获取所有认证凭证的概要（只查询列表展示所需字段，不读取加密的凭证和请求头）"""
+        result = await self.session.execute(
+            select(
+                AuthCredentialDB.source_name,
+                AuthCredentialDB.auth_type,
+                AuthCredentialDB.username,
+                AuthCredentialDB.expires_at,
+                AuthCredentialDB.is_valid,
+                AuthCredentialDB.last_verified,
+                AuthCredentialDB.created_at,
+            ).order_by(AuthCredentialDB.source_name)
+        )
+        return result.all()
+    
     async def get_expiring_soon(self, hours: int = 72) -> List[AuthCredentialDB]:
         """获取即将过期的认证凭证"""
         threshold = utc_now() + timedelta(hours=hours)
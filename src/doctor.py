@@ -635,7 +635,7 @@ async def fix_issues():
         # 对于数据库初始化
         if "init" in result.fix_command:
             from src.database import init_db
-            await init_db()
+            await init_db(force=True)
             console.print("  [green]✓ 数据库初始化完成[/green]")
         # 对于依赖安装
         elif "pip install" in result.fix_command:
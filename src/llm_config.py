@@ -921,7 +921,7 @@ class LLMSetupWizard:
         else:
             console.print(f"[yellow]⚠️ {message}[/yellow]")
     
-    def print_status(self):
+    async def print_status(self):
         """打印配置状态"""
         config = self.manager.get_current_config()
         
@@ -951,8 +951,7 @@ class LLMSetupWizard:
         console.print(f"  API Key:  {config.get_masked_api_key()}")
         
         # 测试连接
-        import asyncio
-        success, message = asyncio.run(self.manager.test_connection())
+        success, message = await self.manager.test_connection()
         
         if success:
             console.print(f"  状态:     [green]✅ 正常[/green]")
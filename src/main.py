@@ -9,6 +9,7 @@ from typing import Dict, List, Optional
 from fastapi import Depends, FastAPI, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth_manager import close_http_client
 from src.config import get_column_config, get_settings
 from src.database import (
     ContentRepository, 
@@ -82,6 +83,7 @@ async def lifespan(app: FastAPI):
     # 关闭时清理
     print(f"[Shutdown] {settings.app_name} 正在关闭...")
     daily_manager.shutdown()
+    await close_http_client()
     print(f"[Shutdown] {settings.app_name} 已关闭")
 
 
@@ -2,8 +2,10 @@
 批量 LLM 处理模块
 支持将多条内容一次性发送给大模型处理
 """
+import asyncio
 import json
 import re
+import time
 from typing import List, Dict, Tuple, Optional, ClassVar, Any
 
 import httpx
@@ -12,6 +14,97 @@ from src.config import get_settings
 from src.models import ContentItem
 
 
+class TokenBucket:
+    """
+    异步令牌桶
+    
+    令牌按 capacity / period 的速率匀速补充，请求前预留令牌，
+    实际用量确定后可退还多预留的部分
+    """
+    
+    def __init__(self, capacity: float, period: float = 60.0):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = capacity
+        self._updated = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    async def acquire(self, n: float = 1) -> float:
+        """预留 n 个令牌（不足时等待补充），返回实际预留数"""
+        n = min(n, self.capacity)
+        while True:
+            self._refill()
+            if self._tokens >= n:
+                self._tokens -= n
+                return n
+            await asyncio.sleep((n - self._tokens) / self.rate)
+    
+    def refund(self, n: float):
+        """退还未使用的令牌"""
+        if n > 0:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + n)
+
+
+class LLMRateLimiter:
+    """
+    LLM 速率限制器（RPM + TPM 双令牌桶）
+    
+    并发数只限制同时在途的请求，真正的瓶颈是服务商的 RPM/TPM 配额，
+    在发出请求前按配额预留，避免触发 429
+    """
+    
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        self.requests = TokenBucket(rpm) if rpm > 0 else None
+        self.tokens = TokenBucket(tpm) if tpm > 0 else None
+    
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """粗略估算 token 数（中文约一字一 token，偏保守）"""
+        return len(text)
+    
+    async def acquire(self, prompt: str, max_tokens: int) -> float:
+        """
+        请求前预留配额
+        
+        Returns:
+            预留的 token 数（用于之后 refund）
+        """
+        if self.requests:
+            await self.requests.acquire(1)
+        if self.tokens:
+            return await self.tokens.acquire(self.estimate_tokens(prompt) + max_tokens)
+        return 0
+    
+    def refund(self, reserved: float, response: Any = None):
+        """根据响应中的实际用量退还多预留的 token（请求失败、没有响应时全部退还）"""
+        if not self.tokens or not reserved:
+            return
+        if response is None:
+            self.tokens.refund(reserved)
+            return
+        usage = getattr(response, "usage", None)
+        used = getattr(usage, "total_tokens", None) if usage else None
+        if used is not None:
+            self.tokens.refund(reserved - used)
+
+
+_rate_limiter: Optional[LLMRateLimiter] = None
+
+
+def get_llm_rate_limiter() -> LLMRateLimiter:
+    """获取 LLM 速率限制器单例（所有 LLM 调用共享配额）"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        settings = get_settings()
+        _rate_limiter = LLMRateLimiter(settings.llm_rpm_limit, settings.llm_tpm_limit)
+    return _rate_limiter
+
+
 class BatchLLMProcessor:
     """
     批量 LLM 处理器
@@ -30,6 +123,8 @@ class BatchLLMProcessor:
     MAX_CONTENT_LENGTH = 48000
     # 超时时间
     TIMEOUT = 300.0  # 增加到 5 分钟，处理大量内容
+    # 分组打包时每组条数（短内容下 5-8 条时摊薄收益最大，再大单次延迟增长会抵消收益）
+    MARSHAL_CHUNK_SIZE = 5
     
     # 类级别客户端缓存（所有实例共享）
     _client_cache: ClassVar[Optional[Any]] = None
@@ -134,13 +229,52 @@ class BatchLLMProcessor:
         
         return await self._process_single_batch(items, style)
     
+    async def marshaled_batch_process(
+        self,
+        items: List[ContentItem],
+        style: str = "3_points",
+        chunk_size: int = None,
+        max_concurrency: int = 5
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        分组打包批量处理
+        
+        每 chunk_size 条内容打包成一个 prompt（一次 API 调用），各组之间并发执行，
+        API 调用次数从 N 降到 N / chunk_size
+        
+        Args:
+            items: 内容条目列表
+            style: 摘要风格
+            chunk_size: 每组条数
+            max_concurrency: 最大并发组数
+            
+        Returns:
+            List[Tuple[str, List[str]]]: (摘要, 关键要点) 列表，与输入顺序一致
+        """
+        if not self.client or not items:
+            return []
+        
+        chunk_size = chunk_size or self.MARSHAL_CHUNK_SIZE
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _process_chunk(chunk):
+            async with semaphore:
+                return await self._process_single_batch(chunk, style)
+        
+        chunk_results = await asyncio.gather(*(_process_chunk(c) for c in chunks))
+        
+        results = []
+        for batch_results in chunk_results:
+            results.extend(batch_results)
+        return results
+    
     async def _process_single_batch(
         self, 
         items: List[ContentItem],
         style: str
     ) -> List[Tuple[str, List[str]]]:
         """处理单批内容"""
-        import time
         start_time = time.time()
         
         # 构建批量 prompt
@@ -148,19 +282,27 @@ class BatchLLMProcessor:
         prompt_build_time = time.time() - start_time
         
         try:
+            max_tokens = min(16000, 1000 + len(items) * 600)  # 增加 token 限制，每条约 600 tokens
+            limiter = get_llm_rate_limiter()
+            reserved = await limiter.acquire(prompt, max_tokens)
+            
             api_start = time.time()
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "你是一个专业的新闻摘要助手。请为每条内容生成简洁准确的摘要，以 JSON 格式返回。"
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=min(16000, 1000 + len(items) * 600)  # 增加 token 限制，每条约 600 tokens
-            )
+            response = None
+            try:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "system", 
+                            "content": "你是一个专业的新闻摘要助手。请为每条内容生成简洁准确的摘要，以 JSON 格式返回。"
+                        },
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.3,
+                    max_tokens=max_tokens
+                )
+            finally:
+                limiter.refund(reserved, response)
             api_time = time.time() - api_start
             
             content = response.choices[0].message.content.strip()
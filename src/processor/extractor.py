@@ -4,15 +4,50 @@
 优化版本：避免阻塞操作
 """
 import asyncio
+import multiprocessing
 import re
+import threading
 from collections import Counter
-from typing import List, Set
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Set
 
 import jieba
 
 from src.models import ContentItem
 
 
+def _init_jieba():
+    """进程池 worker 初始化：每个进程只加载一次 jieba 词典"""
+    jieba.initialize()
+
+
+def _cut_worker(text: str) -> List[str]:
+    """在进程池中执行分词"""
+    return jieba.lcut(text)
+
+
+@lru_cache(maxsize=1)
+def _get_jieba_pool() -> ProcessPoolExecutor:
+    """
+    获取分词进程池（首次使用时创建）
+    
+    jieba 是纯 Python 的 CPU 密集操作，线程池受 GIL 限制，使用进程池才能多核并行；
+    worker 通过 forkserver/spawn 启动，不继承主进程的线程和锁，各自加载一次词典
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(
+        mp_context=multiprocessing.get_context(method),
+        initializer=_init_jieba,
+    )
+
+
+@lru_cache(maxsize=1)
+def _warm_up_jieba():
+    """后台预热主进程的 jieba 词典（摘要器仍在主进程分词），避免首次调用承担加载延迟"""
+    threading.Thread(target=jieba.initialize, daemon=True).start()
+
+
 class KeywordExtractor:
     """关键词提取器（优化版 - 异步非阻塞）"""
     
@@ -32,6 +67,12 @@ class KeywordExtractor:
         "she", "it", "we", "they", "me", "him", "her", "us", "them"
     }
     
+    # 短于该长度的文本直接在事件循环中分词
+    INLINE_TOKENIZE_THRESHOLD = 512
+    
+    def __init__(self):
+        _warm_up_jieba()
+    
     async def extract(self, item: ContentItem, top_k: int = 10) -> List[str]:
         """
         提取关键词（异步非阻塞）
@@ -40,14 +81,45 @@ class KeywordExtractor:
         if not text:
             return []
         
+        if len(text) < self.INLINE_TOKENIZE_THRESHOLD:
+            # 短文本分词只需几十微秒，直接执行比跨进程调度更快
+            freq_keywords = self._extract_by_frequency_sync(text, top_k * 2)
+        else:
+            # 在进程池执行分词（避免阻塞事件循环，且不受 GIL 限制）
+            loop = asyncio.get_running_loop()
+            freq_keywords = await loop.run_in_executor(
+                _get_jieba_pool(), _extract_by_frequency, text, top_k * 2
+            )
+        
+        return self._merge_keywords(item, text, freq_keywords, top_k)
+    
+    def extract_sync(self, item: ContentItem, top_k: int = 10, text: Optional[str] = None) -> List[str]:
+        """
+        提取关键词（同步，在当前线程分词）
+        
+        Args:
+            item: 内容条目
+            top_k: 返回数量
+            text: 预先拼接好的标题+正文（可选，避免重复构造）
+        """
+        text = text or f"{item.title} {item.content or ''}"
+        if not text:
+            return []
+        
+        freq_keywords = self._extract_by_frequency_sync(text, top_k * 2)
+        return self._merge_keywords(item, text, freq_keywords, top_k)
+    
+    def _merge_keywords(
+        self, 
+        item: ContentItem, 
+        text: str, 
+        freq_keywords: List[str], 
+        top_k: int
+    ) -> List[str]:
+        """合并已有关键词、词频关键词和模式匹配关键词"""
         # 合并已有的关键词
         existing = set(item.keywords) if item.keywords else set()
         
-        # 在后台线程执行分词（避免阻塞事件循环）
-        freq_keywords = await asyncio.to_thread(
-            self._extract_by_frequency_sync, text, top_k * 2
-        )
-        
         # 提取模式匹配的关键词（正则很快，不需要放到线程）
         pattern_keywords = self._extract_patterns(text)
         
@@ -68,38 +140,8 @@ class KeywordExtractor:
         return result
     
     def _extract_by_frequency_sync(self, text: str, top_k: int) -> List[str]:
-        """同步词频提取（在线程池中运行）"""
-        try:
-            words = self._tokenize_sync(text)
-            
-            if len(words) < 5:
-                return words[:top_k]
-            
-            filtered_words = [
-                w for w in words 
-                if w.lower() not in self.STOP_WORDS 
-                and len(w) > 1
-                and not w.isdigit()
-            ]
-            
-            word_freq = Counter(filtered_words)
-            return [word for word, _ in word_freq.most_common(top_k)]
-            
-        except Exception:
-            return []
-    
-    def _tokenize_sync(self, text: str) -> List[str]:
-        """同步分词（在线程池中运行）"""
-        chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', text))
-        total_chars = len(text)
-        
-        if chinese_chars > total_chars * 0.1:  # 中文内容
-            words = list(jieba.cut(text))
-            words = [w.strip() for w in words if w.strip() and len(w.strip()) > 1]
-            return words
-        else:  # 英文内容
-            words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-            return [w for w in words if len(w) > 2]
+        """同步词频提取"""
+        return _extract_by_frequency(text, top_k)
     
     def _extract_patterns(self, text: str) -> List[str]:
         """提取模式匹配的关键词"""
@@ -122,6 +164,42 @@ class KeywordExtractor:
         return keywords
 
 
+def _extract_by_frequency(text: str, top_k: int) -> List[str]:
+    """词频提取（模块级函数，提交到进程池时只需序列化文本和 top_k）"""
+    try:
+        words = _tokenize(text)
+        
+        if len(words) < 5:
+            return words[:top_k]
+        
+        filtered_words = [
+            w for w in words 
+            if w.lower() not in KeywordExtractor.STOP_WORDS 
+            and len(w) > 1
+            and not w.isdigit()
+        ]
+        
+        word_freq = Counter(filtered_words)
+        return [word for word, _ in word_freq.most_common(top_k)]
+        
+    except Exception:
+        return []
+
+
+def _tokenize(text: str) -> List[str]:
+    """分词：中文内容使用 jieba，英文内容按单词切分"""
+    chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', text))
+    total_chars = len(text)
+    
+    if chinese_chars > total_chars * 0.1:  # 中文内容
+        words = list(jieba.cut(text))
+        words = [w.strip() for w in words if w.strip() and len(w.strip()) > 1]
+        return words
+    else:  # 英文内容
+        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+        return [w for w in words if len(w) > 2]
+
+
 class EntityExtractor:
     """实体提取器（简化版）"""
     
@@ -132,9 +210,9 @@ class EntityExtractor:
         "technology": r"AI|人工智能|机器学习|深度学习|区块链|云计算|大数据|5G|物联网|AR|VR|NLP|CV"
     }
     
-    def extract(self, item: ContentItem) -> List[str]:
-        """提取实体"""
-        text = f"{item.title} {item.content or ''}"
+    def extract(self, item: ContentItem, text: Optional[str] = None) -> List[str]:
+        """提取实体（text 为预先拼接好的标题+正文，可选）"""
+        text = text or f"{item.title} {item.content or ''}"
         if not text:
             return []
         
@@ -163,9 +241,9 @@ class TopicClassifier:
         "创业投资": ["创业", "投资", "融资", "VC", "天使轮", "IPO", "独角兽", "估值"]
     }
     
-    def classify(self, item: ContentItem) -> List[str]:
-        """主题分类"""
-        text = f"{item.title} {item.content or ''}".lower()
+    def classify(self, item: ContentItem, text: Optional[str] = None) -> List[str]:
+        """主题分类（text 为预先拼接好的标题+正文，可选）"""
+        text = (text or f"{item.title} {item.content or ''}").lower()
         if not text:
             return []
         
@@ -13,6 +13,7 @@ import jieba
 
 from src.config import get_settings
 from src.models import ContentItem
+from src.processor.batch_llm import get_llm_rate_limiter
 
 settings = get_settings()
 
@@ -209,15 +210,22 @@ class LLMSummarizer(Summarizer):
         prompt = self._build_prompt(item, style, max_length)
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "你是一个专业的新闻摘要助手。请根据提供的内容生成简洁、准确的摘要。"},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.5,
-                max_tokens=500
-            )
+            limiter = get_llm_rate_limiter()
+            reserved = await limiter.acquire(prompt, 500)
+            
+            response = None
+            try:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": "你是一个专业的新闻摘要助手。请根据提供的内容生成简洁、准确的摘要。"},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.5,
+                    max_tokens=500
+                )
+            finally:
+                limiter.refund(reserved, response)
             
             summary = response.choices[0].message.content.strip()
             
@@ -330,6 +338,36 @@ class LLMSummarizer(Summarizer):
         return summaries
 
 
+    async def batch_summarize_marshaled(
+        self,
+        items: List[ContentItem],
+        style: str = "3_points",
+        k: int = None
+    ) -> List[str]:
+        """
+        分组打包批量摘要（每 k 条合并为一次 API 调用，各组并发执行）
+        """
+        if not items:
+            return []
+        
+        if not self.client:
+            return await self.batch_summarize(items, style, use_batch_api=False)
+        
+        from src.processor.batch_llm import BatchLLMProcessor
+        
+        batch_processor = BatchLLMProcessor()
+        results = await batch_processor.marshaled_batch_process(
+            items, style, chunk_size=k, max_concurrency=self.max_concurrency
+        )
+        
+        for item, (summary, key_points) in zip(items, results):
+            item.summary = summary
+            if key_points:
+                item.key_points = key_points
+        
+        return [r[0] for r in results]
+
+
 class SummarizerFactory:
     """摘要器工厂"""
     
@@ -374,38 +412,45 @@ class ContentProcessor:
     
     async def process(self, item: ContentItem) -> ContentItem:
         """处理内容条目"""
-        # 清洗内容
+        # 清洗、关键词、实体、主题、阅读时间（CPU 阶段，放到线程中执行，避免阻塞事件循环）
+        item = await asyncio.to_thread(self.process_item_cpu, item)
+        
+        # 生成摘要（异步）
+        if not item.summary:
+            style = "3_points"
+            item.summary = await self.summarizer.summarize(item, style=style)
+        
+        # 提取关键要点
+        if not item.key_points:
+            item.key_points = await self._extract_key_points(item)
+        
+        return item
+    
+    def process_item_cpu(self, item: ContentItem) -> ContentItem:
+        """
+        单次遍历完成清洗、关键词、实体、主题（同步 CPU 阶段，可放到线程池执行）
+        
+        标题+正文只拼接一次，三个提取器共享同一份文本
+        """
         if item.content:
             if "<" in item.content and ">" in item.content:
                 item.content = self.cleaner.clean(item.content)
             else:
                 item.content = self.cleaner.clean_markdown(item.content)
         
-        # 提取关键词（异步）
+        text = f"{item.title} {item.content or ''}"
+        
         if not item.keywords:
-            item.keywords = await self.keyword_extractor.extract(item)
+            item.keywords = self.keyword_extractor.extract_sync(item, text=text)
         
-        # 提取实体（同步，很快）
         if not item.entities:
-            item.entities = self.entity_extractor.extract(item)
+            item.entities = self.entity_extractor.extract(item, text=text)
         
-        # 主题分类（同步，很快）
         if not item.topics:
-            item.topics = self.topic_classifier.classify(item)
-        
-        # 生成摘要（异步）
-        if not item.summary:
-            style = "3_points"
-            item.summary = await self.summarizer.summarize(item, style=style)
-        
-        # 提取关键要点
-        if not item.key_points:
-            item.key_points = await self._extract_key_points(item)
+            item.topics = self.topic_classifier.classify(item, text=text)
         
-        # 预估阅读时间
         if item.content and not item.read_time:
-            word_count = len(item.content)
-            item.read_time = max(1, word_count // 400)
+            item.read_time = max(1, len(item.content) // 400)
         
         return item
     
@@ -4,7 +4,7 @@
 """
 import asyncio
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -388,11 +388,17 @@ async def test_source_filter(source_name: str):
 
 # CLI 命令函数
 def cli_test_rules(column_id: Optional[str] = None, 
-                   source_name: Optional[str] = None):
-    """CLI 入口"""
+                   source_name: Optional[str] = None,
+                   run: Callable[[Coroutine], Any] = asyncio.run):
+    """
+    CLI 入口
+    
+    Args:
+        run: 运行协程的函数（CLI 传入共享事件循环的运行器，默认 asyncio.run）
+    """
     if column_id:
-        asyncio.run(test_column_rules(column_id))
+        run(test_column_rules(column_id))
     elif source_name:
-        asyncio.run(test_source_filter(source_name))
+        run(test_source_filter(source_name))
     else:
         console.print("[yellow]请指定 --column 或 --source[/yellow]")
@@ -3,8 +3,9 @@
 提供定时任务的可视化管理和手动控制
 """
 import asyncio
+import re
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Dict, List, Optional, Callable
 
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, JobExecutionEvent
@@ -39,6 +40,13 @@ class TaskHistory:
     result: Optional[Dict] = None
 
 
+def _parse_day(value: str) -> datetime:
+    """解析 YYYY-MM-DD 日期为当天零点（naive），拒绝带时间/时区或其他 ISO 写法（如 20240115、2024-W03-1）"""
+    if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", value or ""):
+        raise ValueError(f"日期格式应为 YYYY-MM-DD: {value}")
+    return datetime.combine(date.fromisoformat(value), datetime.min.time())
+
+
 class SchedulerManager:
     """定时任务管理器"""
     
@@ -281,10 +289,8 @@ class SchedulerManager:
         Returns:
             补发结果
         """
-        from datetime import datetime
-        
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
+        start = _parse_day(start_date)
+        end = _parse_day(end_date)
         
         if start > end:
             raise ValueError("开始日期不能晚于结束日期")
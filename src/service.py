@@ -4,7 +4,7 @@
 """
 import os
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -226,6 +226,14 @@ class DailyAgentService:
             ErrorHandler.success(f"采集完成，保存 {total_saved} 条内容")
         return results
     
+    async def collect_iter(self) -> AsyncIterator[Tuple[str, CollectorResult]]:
+        """执行所有采集，按完成先后逐个产出结果（每个来源完成后立即保存其内容）"""
+        async for name, result in self.collector_manager.iter_collect():
+            if result.success:
+                for item in result.items:
+                    await self._save_item(item)
+            yield name, result
+    
     async def process_content(self, item: ContentItem) -> ContentItem:
         """处理内容"""
         return await self.content_processor.process(item)
@@ -440,7 +448,7 @@ class DailyAgentService:
     async def push_report(
         self,
         report: DailyReport,
-        channels: Optional[List[str]] = None,
+        channels: Optional[Sequence[str]] = None,
         user_id: str = "default"
     ) -> Dict[ChannelType, PushResult]:
         """
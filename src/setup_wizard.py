@@ -959,20 +959,36 @@ async def export_config(user_id: str = "default", format: str = "yaml", output:
         output = f"daily-agent-config-{user_id}.{format}"
     
     # 写入文件
-    if format == "json":
-        with open(output, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
-    else:  # yaml
-        from ruamel.yaml import YAML
-        yaml = YAML()
-        yaml.default_flow_style = False
-        yaml.allow_unicode = True
-        with open(output, "w", encoding="utf-8") as f:
-            yaml.dump(config, f)
+    _dump_config_file(config, output, format)
     
     return output
 
 
+def _dump_config_file(config: dict, output: str, format: str = "yaml"):
+    """写入导出的配置文件（YAML 使用 safe dumper，只输出 _load_config_file 可读回的标准类型）"""
+    with open(output, "w", encoding="utf-8") as f:
+        if format == "json":
+            json.dump(config, f, ensure_ascii=False, indent=2)
+        else:  # yaml
+            import yaml
+            from src.config import YamlDumper
+            yaml.dump(config, f, Dumper=YamlDumper, allow_unicode=True, sort_keys=False)
+
+
+def _load_config_file(filepath: str) -> dict:
+    """
+    读取导出的配置文件
+    
+    YAML 按 1.2 规范解析（与早期 ruamel 导出的文件一致）：no/on/yes/off、09:00
+    等未加引号的值保持为字符串，不会被 YAML 1.1 解析成布尔值或六十进制数
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        if filepath.endswith(".json"):
+            return json.load(f)
+        from ruamel.yaml import YAML
+        return YAML(typ="safe").load(f)
+
+
 async def import_config(filepath: str, user_id: str = "default", overwrite: bool = False) -> bool:
     """
     导入用户配置
@@ -991,14 +1007,7 @@ async def import_config(filepath: str, user_id: str = "default", overwrite: bool
         raise FileNotFoundError(f"配置文件不存在: {filepath}")
     
     # 读取配置
-    if filepath.endswith(".json"):
-        with open(filepath, "r", encoding="utf-8") as f:
-            config = json.load(f)
-    else:  # yaml
-        from ruamel.yaml import YAML
-        yaml = YAML()
-        with open(filepath, "r", encoding="utf-8") as f:
-            config = yaml.load(f)
+    config = _load_config_file(filepath)
     
     # 导入到数据库
     from src.database import UserProfileDB, get_session
@@ -1339,12 +1339,7 @@ async def dashboard_page():
             
             # 推送渠道
             settings = get_settings()
-            channel_count = sum([
-                bool(settings.telegram_bot_token),
-                bool(settings.slack_bot_token),
-                bool(settings.discord_bot_token),
-                bool(settings.smtp_host)
-            ])
+            channel_count = len(settings.configured_channels())
     except:
         today_collected = 0
         weekly_reports = 0
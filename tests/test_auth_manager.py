@@ -0,0 +1,35 @@
+"""
+认证管理测试
+"""
+from src.auth_manager import CURLParser
+
+
+def test_parse_cookie_string():
+    """测试 Cookie 字符串解析"""
+    cookies = CURLParser._parse_cookie_string(" a=1; b = 2 ;c=x=y; flag; d=")
+    
+    assert cookies == {"a": "1", "b": "2", "c": "x=y", "d": ""}
+
+
+def test_parse_curl_cookie_header():
+    """测试从 cURL 命令提取 Cookie"""
+    parsed = CURLParser.parse(
+        "curl 'https://web.okjike.com/api/users/me' "
+        "-H 'user-agent: UA' -H 'cookie: token=abc; uid=42'"
+    )
+    
+    assert parsed["url"] == "https://web.okjike.com/api/users/me"
+    assert parsed["cookies"] == {"token": "abc", "uid": "42"}
+    assert "cookie" not in parsed["headers"]
+
+
+def test_credentials_roundtrip():
+    """测试凭证加密解密（含未压缩的旧格式）"""
+    from src.auth_manager import _fernet, decrypt_credentials, encrypt_credentials
+    
+    cookie = "; ".join(f"key{i}=value{i}" for i in range(50))
+    
+    assert decrypt_credentials(encrypt_credentials(cookie)) == cookie
+    
+    legacy = _fernet().encrypt(cookie.encode()).decode()
+    assert decrypt_credentials(legacy) == cookie
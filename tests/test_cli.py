@@ -0,0 +1,141 @@
+"""
+命令行工具测试
+"""
+import os
+import sys
+
+import click
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.cli.__main__ import _HELP
+
+
+def test_static_help_matches_cli():
+    """测试快速路径的静态帮助与 Click 生成的帮助一致"""
+    result = CliRunner().invoke(cli, ["--help"], prog_name="python -m src.cli")
+    
+    assert result.exit_code == 0
+    assert result.output == _HELP
+
+
+def test_single_cli_module():
+    """测试命令组只在 src.cli 中定义一次（延迟加载的子命令组不会重复注册）"""
+    result = CliRunner().invoke(cli, ["auth", "--help"])
+    
+    assert result.exit_code == 0
+    modules = [
+        name for name, module in list(sys.modules.items())
+        if isinstance(getattr(module, "cli", None), click.Group)
+        and module.cli.callback.__module__ == name
+    ]
+    assert modules == ["src.cli"]
+
+
+def test_config_reuses_setup_export_import():
+    """测试 config 与 setup 组的导出/导入是同一命令对象"""
+    ctx = click.Context(cli)
+    config = cli.get_command(ctx, "config")
+    setup = cli.get_command(ctx, "setup")
+    
+    for name in ("export", "import"):
+        assert config.get_command(ctx, name) is setup.get_command(ctx, name)
+
+
+def test_generate_rejects_malformed_date():
+    """测试 generate 在进入事件循环前校验 ISO 日期格式"""
+    for value in ["2024/01/01", "20240115", "2024-W03-1", "2024-01-15T23:59+08:00"]:
+        result = CliRunner().invoke(cli, ["generate", "--date", value])
+        
+        assert result.exit_code == 2, value
+        assert "YYYY-MM-DD" in result.output
+
+
+def test_credential_status_boundaries():
+    """测试认证状态判断（剩余天数 <= 3 视为即将过期）"""
+    from datetime import datetime, timedelta, timezone
+    from src.cli._cmds.auth import _credential_status
+    
+    now = datetime.now(timezone.utc)
+    soon = now + timedelta(days=4)
+    
+    assert "失效" in _credential_status(False, now + timedelta(days=30), now, soon)
+    assert "已过期" in _credential_status(True, now - timedelta(minutes=1), now, soon)
+    assert "即将过期" in _credential_status(True, now + timedelta(days=3, hours=23), now, soon)
+    assert "有效" in _credential_status(True, now + timedelta(days=4, minutes=1), now, soon)
+    assert "有效" in _credential_status(True, None, now, soon)
+
+
+def test_auth_update_unknown_source():
+    """测试 auth update 对不支持的渠道直接提示，不进入添加流程"""
+    result = CliRunner().invoke(cli, ["auth", "update", "not-a-source"])
+    
+    assert result.exit_code == 0
+    assert "不支持的渠道" in result.output
+
+
+def test_cli_import_is_lightweight():
+    """测试导入命令行模块时不加载 Rich、SQLAlchemy 等重依赖（只在命令执行时按需导入）"""
+    import subprocess
+    
+    code = (
+        "import sys, src.cli; "
+        "print(sorted(m for m in ('rich', 'sqlalchemy', 'yaml', 'pydantic') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    
+    assert result.stdout.strip() == "[]"
+
+
+def test_config_import_reads_legacy_yaml_export(tmp_path):
+    """测试导入旧版（ruamel）导出的 YAML：no/on/yes/off 等值保持为字符串"""
+    from ruamel.yaml import YAML
+    from src.setup_wizard import _dump_config_file, _load_config_file
+    
+    config = {
+        "user_id": "default",
+        "profile": {"industry": "no", "position": "on", "expertise": ["yes", "off"]},
+        "preferences": {"push_time": "09:00", "summary_style": "brief"},
+    }
+    legacy = YAML()
+    legacy.default_flow_style = False
+    legacy.allow_unicode = True
+    path = tmp_path / "config.yaml"
+    with open(path, "w", encoding="utf-8") as f:
+        legacy.dump(config, f)
+    
+    assert "industry: no\n" in path.read_text(encoding="utf-8")
+    assert _load_config_file(str(path)) == config
+    
+    # 重新导出只使用标准标签，且能原样读回
+    exported = tmp_path / "exported.yaml"
+    _dump_config_file(_load_config_file(str(path)), str(exported))
+    
+    assert "!!" not in exported.read_text(encoding="utf-8")
+    assert _load_config_file(str(exported)) == config
+
+
+def test_setup_telegram_failed_test_without_description(monkeypatch):
+    """测试 Telegram 返回 ok=false 且无 description 时仍视为失败并询问是否保存"""
+    import httpx
+    
+    class FakeResponse:
+        def __init__(self, status_code, data):
+            self.status_code = status_code
+            self._data = data
+        
+        def json(self):
+            return self._data
+    
+    updates = {"ok": True, "result": [{"message": {"chat": {"id": 42, "title": "me"}}}]}
+    monkeypatch.setattr(httpx, "get", lambda *args, **kwargs: FakeResponse(200, updates))
+    monkeypatch.setattr(httpx, "post", lambda *args, **kwargs: FakeResponse(400, {"ok": False}))
+    
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(cli, ["setup-telegram"], input="123:abc\nn\n")
+        
+        assert result.exit_code == 0
+        assert "测试失败: HTTP 400" in result.output
+        assert "连接测试成功" not in result.output
+        assert not os.path.exists(".env")
@@ -55,3 +55,19 @@ def test_topic_classifier():
     
     assert len(topics) > 0
     assert "人工智能" in topics or "AI" in str(topics)
+
+
+async def test_rate_limiter_refunds_failed_request():
+    """测试请求失败（没有响应）时退还全部预留的 token"""
+    from types import SimpleNamespace
+    from src.processor.batch_llm import LLMRateLimiter
+    
+    limiter = LLMRateLimiter(tpm=1000)
+    
+    reserved = await limiter.acquire("x" * 100, 200)
+    limiter.refund(reserved, None)
+    assert limiter.tokens._tokens == pytest.approx(1000, abs=1)
+    
+    reserved = await limiter.acquire("x" * 100, 200)
+    limiter.refund(reserved, SimpleNamespace(usage=SimpleNamespace(total_tokens=150)))
+    assert limiter.tokens._tokens == pytest.approx(850, abs=1)